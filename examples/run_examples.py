@@ -6,7 +6,11 @@ This script demonstrates how to use the various YAML configuration files
 to create different types of graphs with different styling approaches.
 """
 
+import functools
+import math
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 import numpy as np
@@ -17,121 +21,124 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from simple_grapher import Config, DataProcessor, GraphBuilder
 
+# Numba is optional; without it the extra series are built with numpy
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
 
+# Only JIT-compile when there are enough extra series to amortize the compile
+NUMBA_MIN_SERIES = 16
+
+if njit is not None:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def fill_series(x, phases, noise, out):
+        """Fill out[i, j] with sin(x[j] + phases[i]) + noise[i, j]."""
+        for i in prange(phases.size):
+            for j in range(x.size):
+                out[i, j] = math.sin(x[j] + phases[i]) + noise[i, j]
+
+
+@functools.lru_cache(maxsize=1)
 def create_sample_data():
-    """Create sample data for demonstration."""
+    """
+    Create sample data for demonstration.
+
+    The result is cached and shared between examples, so treat it as read-only.
+    """
     x = np.linspace(0, 10, 50)
 
-    data = {
-        "x": x,
-        "y1": np.sin(x),
-        "y2": np.cos(x),
-        "y3": np.sin(x + np.pi / 4),
-        "y4": np.cos(x + np.pi / 4),
-        "y5": np.sin(x + np.pi / 2),
-        "y6": np.cos(x + np.pi / 2),
-    }
-
-    df = pd.DataFrame(data)
+    # Columns are x, then sin/cos pairs at phase offsets 0, pi/4 and pi/2,
+    # filled in place with one broadcasted call each
+    phases = np.array([0, np.pi / 4, np.pi / 2])
+    args = x[:, None] + phases[None, :]
+    data = np.empty((len(x), 7))
+    data[:, 0] = x
+    data[:, 1::2] = np.sin(args)
+    data[:, 2::2] = np.cos(args)
+
+    df = pd.DataFrame(data, columns=["x", "y1", "y2", "y3", "y4", "y5", "y6"])
     return df
 
 
-def create_dataframes_from_config(config):
-    """Create dataframes directly from configuration without CSV files."""
+def create_series_from_config(config):
+    """Create (x, y) arrays directly from configuration without CSV files."""
     df = create_sample_data()
-    dataframes = {}
+    series = {}
+
+    # Every series shares the same x values, so they all reference one array
+    x_arr = df["x"].to_numpy()
+
+    # Series beyond the six predefined patterns are noisy phase-shifted sine
+    # waves; generate all of them, noise included, in one vectorized pass
+    extra = max(0, len(config.data.sources) - 6)
+    if extra:
+        rng = np.random.default_rng()
+        phases = np.arange(7, 7 + extra) * (np.pi / 6)
+        noise = rng.normal(0, 0.1, size=(extra, len(x_arr)))
+        if njit is not None and extra >= NUMBA_MIN_SERIES:
+            extra_series = np.empty_like(noise)
+            fill_series(x_arr, phases, noise, extra_series)
+        else:
+            extra_series = np.sin(x_arr[None, :] + phases[:, None]) + noise
 
     for source in config.data.sources:
         # Generate random data for each series
-        series_num = len(dataframes) + 1
+        series_num = len(series) + 1
         if series_num <= 6:
             # Use predefined patterns for first 6 series
-            y_data = df[f"y{series_num}"].values
+            y_data = df[f"y{series_num}"].to_numpy(copy=False)
         else:
-            # Generate random data for additional series
-            x = np.linspace(0, 10, 50)
-            y_data = np.sin(x + series_num * np.pi / 6) + np.random.normal(
-                0, 0.1, len(x)
-            )
+            # Use the pre-generated random data for additional series
+            y_data = extra_series[series_num - 7]
 
-        # Create dataframe with x, y columns
-        series_df = pd.DataFrame({"x": df["x"], "y": y_data})
+        series[source.label] = (x_arr, y_data)
 
-        dataframes[source.label] = series_df
+    return series
 
-    return dataframes
 
+# Graph builder shared by every example run in the current worker process
+_graph_builder = None
 
-def run_config_example(config_file, description):
-    """Run a single configuration example."""
-    print(f"\n=== {description} ===")
-    print(f"Using config: {config_file}")
 
-    try:
-        # Load configuration
-        config = Config.from_yaml_file(config_file)
-        print(f"✓ Loaded config: '{config.graph.title}'")
+def init_worker():
+    """Set up a worker process with one reusable graph builder."""
+    global _graph_builder
+    # Each graph is saved before the next one is created, so the worker can
+    # redraw into the same figure instead of building a new one per example
+    _graph_builder = GraphBuilder(reuse_figure=True)
 
-        # Create graph builder
-        graph_builder = GraphBuilder()
 
-        # Generate data directly from config
-        dataframes = create_dataframes_from_config(config)
+def run_example(config_file, description, graph_type):
+    """
+    Run a single configuration example.
 
-        if not dataframes:
-            print("⚠️  No data loaded - skipping graph creation")
-            return
+    Returns the example's log as a string so that output from examples
+    running in parallel isn't interleaved.
+    """
+    if _graph_builder is None:
+        init_worker()
 
-        # Create graph
-        fig = graph_builder.create_graph_from_dataframes(
-            dataframes,
-            "line",  # Default to line plot
-            config.graph.title,
-            config.graph.x_axis.label,
-            config.graph.y_axis.label,
-            config.graph.style,
-        )
-
-        if fig:
-            # Save graph
-            graph_builder.save_graph(
-                fig,
-                config.output.save_path,
-                dpi=config.output.dpi,
-                format=config.output.format,
-            )
-            print(f"✓ Graph saved to: {config.output.save_path}")
-        else:
-            print("✗ Failed to create graph")
-
-    except Exception as e:
-        print(f"✗ Error: {e}")
-
-
-def run_scatter_example(config_file, description):
-    """Run a scatter plot configuration example."""
-    print(f"\n=== {description} ===")
-    print(f"Using config: {config_file}")
+    kind = "Scatter plot" if graph_type == "scatter" else "Graph"
+    log = [f"\n=== {description} ===", f"Using config: {config_file}"]
 
     try:
         # Load configuration
         config = Config.from_yaml_file(config_file)
-        print(f"✓ Loaded config: '{config.graph.title}'")
-
-        # Create graph builder
-        graph_builder = GraphBuilder()
+        log.append(f"✓ Loaded config: '{config.graph.title}'")
 
         # Generate data directly from config
-        dataframes = create_dataframes_from_config(config)
+        series = create_series_from_config(config)
 
-        if not dataframes:
-            print("⚠️  No data loaded - skipping graph creation")
-            return
+        if not series:
+            log.append("⚠️  No data loaded - skipping graph creation")
+            return "\n".join(log)
 
-        # Create scatter plot
-        fig = graph_builder.create_graph_from_dataframes(
-            dataframes,
-            "scatter",  # Scatter plot
+        # Create graph
+        fig = _graph_builder.create_graph_from_arrays(
+            series,
+            graph_type,
             config.graph.title,
             config.graph.x_axis.label,
             config.graph.y_axis.label,
@@ -140,18 +147,20 @@ def run_scatter_example(config_file, description):
 
         if fig:
             # Save graph
-            graph_builder.save_graph(
+            _graph_builder.save_graph(
                 fig,
                 config.output.save_path,
                 dpi=config.output.dpi,
                 format=config.output.format,
             )
-            print(f"✓ Scatter plot saved to: {config.output.save_path}")
+            log.append(f"✓ {kind} saved to: {config.output.save_path}")
         else:
-            print("✗ Failed to create scatter plot")
+            log.append(f"✗ Failed to create {kind.lower()}")
 
     except Exception as e:
-        print(f"✗ Error: {e}")
+        log.append(f"✗ Error: {e}")
+
+    return "\n".join(log)
 
 
 def main():
@@ -174,13 +183,19 @@ def main():
         ("scatter_defaults.yaml", "Scatter Plot Defaults"),
     ]
 
-    # Run line plot examples
-    for config_file, description in examples:
-        run_config_example(config_file, description)
+    jobs = [(config_file, description, "line") for config_file, description in examples]
+    jobs += [
+        (config_file, description, "scatter")
+        for config_file, description in scatter_examples
+    ]
 
-    # Run scatter plot examples
-    for config_file, description in scatter_examples:
-        run_scatter_example(config_file, description)
+    # Examples are independent, so render them in parallel processes
+    # (matplotlib isn't thread-safe, but separate processes are fine)
+    max_workers = min(len(jobs), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=init_worker) as pool:
+        futures = [pool.submit(run_example, *job) for job in jobs]
+        for future in as_completed(futures):
+            print(future.result())
 
     print("\n=== Summary ===")
     print("✓ All configuration examples completed!")
@@ -5,16 +5,35 @@ Simple Grapher - A command line tool for creating simple graphs and visualizatio
 __version__ = "0.1.0"
 __author__ = "anishnya"
 
-from .cli import main
-from .core import Config, DataProcessor, GraphBuilder
-from .utils import YAMLParser, parse_config_file, parse_data_file
-
-__all__ = [
-    "main",
-    "Config",
-    "GraphBuilder",
-    "DataProcessor",
-    "YAMLParser",
-    "parse_config_file",
-    "parse_data_file",
-]
+import importlib
+from typing import Any, List
+
+# Public names and the submodules defining them. They are imported on first
+# access (PEP 562) so that importing the package doesn't pull in pandas and
+# matplotlib until they're actually needed.
+_LAZY_IMPORTS = {
+    "main": ".cli",
+    "Config": ".core",
+    "GraphBuilder": ".core",
+    "DataProcessor": ".core",
+    "YAMLParser": ".utils",
+    "parse_config_file": ".utils",
+    "parse_data_file": ".utils",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names lazily on first access."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List module attributes, including the lazily imported names."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
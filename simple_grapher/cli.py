@@ -3,12 +3,13 @@ Command line interface for Simple Grapher.
 """
 
 import argparse
+import logging
 import sys
 from typing import Any, Dict
 
 from simple_grapher.core.data_processor import DataProcessor
 from simple_grapher.core.graph_builder import GraphBuilder
-from simple_grapher.utils.yaml_parser import YAMLParser
+from simple_grapher.utils.yaml_parser import parse_config_file
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -20,14 +21,18 @@ def create_parser() -> argparse.ArgumentParser:
 
     # Arguments
     parser.add_argument("--input", action="store", required=True)
+    parser.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        help="Don't rewrite an output file that already holds the same graph",
+    )
 
     return parser
 
 
 def process_input(input: str) -> Dict[str, Any]:
-    """Open the YAML file and parse the data."""
-    yaml_parser = YAMLParser()
-    return yaml_parser.load_file(input)
+    """Open the YAML (or JSON) file and parse the data."""
+    return parse_config_file(input)
 
 
 def create_graph_config(data: Any) -> Any:
@@ -39,6 +44,7 @@ def main() -> int:
     """Main entry point for the CLI."""
     parser = create_parser()
     args: argparse.Namespace = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
 
     try:
         # Process the input configuration
@@ -63,7 +69,9 @@ def main() -> int:
         output_path = output_config.get("save_path", "./output/graph.png")
         dpi = output_config.get("dpi", 300)
 
-        success = graph_builder.save_graph(figure, output_path, dpi=dpi)
+        success = graph_builder.save_graph(
+            figure, output_path, dpi=dpi, skip_unchanged=args.skip_unchanged
+        )
 
         if success:
             print(f"Graph successfully created and saved to {output_path}")
@@ -5,14 +5,77 @@ This module provides dataclasses and utilities for managing configuration
 that matches the structure of YAML configuration files.
 """
 
-from dataclasses import dataclass, field
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field, fields, is_dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
-
-from ..utils.yaml_parser import YAMLParser
-
-
-@dataclass
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from ..utils.yaml_parser import YAMLParser, file_cache_key
+
+T = TypeVar("T")
+
+# Slotted dataclasses need Python 3.10+; older versions keep per-instance dicts
+_DATACLASS_OPTIONS: Dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
+# Set while building configs from data that has already been validated once;
+# __post_init__ hooks skip their checks while it is True
+_TRUSTED: ContextVar[bool] = ContextVar("trusted_config", default=False)
+
+
+@contextmanager
+def _trusted() -> Iterator[None]:
+    """Skip config validation for dataclasses constructed inside this block."""
+    token = _TRUSTED.set(True)
+    try:
+        yield
+    finally:
+        _TRUSTED.reset(token)
+
+
+# Markers and line styles accepted by LineStyleConfig, in display order
+VALID_MARKERS = [
+    "o",
+    "s",
+    "^",
+    "v",
+    "<",
+    ">",
+    "p",
+    "*",
+    "+",
+    "x",
+    "D",
+    "h",
+    "H",
+    "1",
+    "2",
+    "3",
+    "4",
+    "|",
+    "_",
+    ".",
+    ",",
+]
+VALID_LINE_STYLES = ["-", "--", "-.", ":"]
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class FontsConfig:
     """Configuration for font settings."""
 
@@ -21,20 +84,20 @@ class FontsConfig:
     legend_size: int = 10
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class GridConfig:
     """Configuration for grid settings."""
 
     show: bool = True
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class LineStyleConfig:
     """Configuration for line and marker styling."""
 
     # Available markers: 'o', 's', '^', 'v', '<', '>', 'p', '*', '+', 'x', 'D', 'h', 'H', '1', '2', '3', '4', '|', '_', '.', ','
     # Default to no markers (empty list means no markers)
-    markers: List[str] = field(default_factory=lambda: [])
+    markers: List[str] = field(default_factory=list)
     # Available line styles: '-', '--', '-.', ':'
     # Default to solid lines only
     line_styles: List[str] = field(default_factory=lambda: ["-"])
@@ -45,45 +108,30 @@ class LineStyleConfig:
     # Marker size
     marker_size: float = 6.0
 
+    # Lookup sets for validation (class attributes, not dataclass fields)
+    _VALID_MARKERS = frozenset(VALID_MARKERS)
+    _VALID_LINE_STYLES = frozenset(VALID_LINE_STYLES)
+
     def __post_init__(self) -> None:
         """Validate marker and line style configuration after initialization."""
-        # Validate markers
-        valid_markers = [
-            "o",
-            "s",
-            "^",
-            "v",
-            "<",
-            ">",
-            "p",
-            "*",
-            "+",
-            "x",
-            "D",
-            "h",
-            "H",
-            "1",
-            "2",
-            "3",
-            "4",
-            "|",
-            "_",
-            ".",
-            ",",
-        ]
-        for marker in self.markers:
-            if marker not in valid_markers:
-                raise ValueError(
-                    f"Invalid marker '{marker}'. Valid markers: {valid_markers}"
-                )
-
-        # Validate line styles
-        valid_line_styles = ["-", "--", "-.", ":"]
-        for line_style in self.line_styles:
-            if line_style not in valid_line_styles:
-                raise ValueError(
-                    f"Invalid line style '{line_style}'. Valid line styles: {valid_line_styles}"
-                )
+        if _TRUSTED.get():
+            return
+
+        # Validate markers and line styles with one set check each; only
+        # look for the offending value once a check has failed
+        if not self._VALID_MARKERS.issuperset(self.markers):
+            marker = next(m for m in self.markers if m not in self._VALID_MARKERS)
+            raise ValueError(
+                f"Invalid marker '{marker}'. Valid markers: {VALID_MARKERS}"
+            )
+
+        if not self._VALID_LINE_STYLES.issuperset(self.line_styles):
+            line_style = next(
+                s for s in self.line_styles if s not in self._VALID_LINE_STYLES
+            )
+            raise ValueError(
+                f"Invalid line style '{line_style}'. Valid line styles: {VALID_LINE_STYLES}"
+            )
 
         # Validate numeric values
         if self.line_width <= 0:
@@ -92,18 +140,20 @@ class LineStyleConfig:
             raise ValueError("Marker size must be positive")
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class StyleConfig:
     """Configuration for graph styling."""
 
     width: int = 10
     height: int = 10
+    # Reduce line and scatter series to a few points per pixel before plotting
+    downsample: bool = False
     fonts: FontsConfig = field(default_factory=FontsConfig)
     grid: GridConfig = field(default_factory=GridConfig)
     line_style: LineStyleConfig = field(default_factory=LineStyleConfig)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class AxisConfig:
     """Configuration for axis settings."""
 
@@ -112,7 +162,7 @@ class AxisConfig:
     max: Optional[float] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class GraphConfig:
     """Configuration for graph settings."""
 
@@ -122,7 +172,7 @@ class GraphConfig:
     style: StyleConfig = field(default_factory=StyleConfig)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class DataSource:
     """Configuration for a single data source."""
 
@@ -131,13 +181,13 @@ class DataSource:
 
     def __post_init__(self) -> None:
         """Validate the data source after initialization."""
-        if not self.file:
+        if not self.file and not _TRUSTED.get():
             raise ValueError("Data source 'file' is required")
         if not self.label:
             self.label = Path(self.file).stem
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class DataConfig:
     """Configuration for data sources."""
 
@@ -150,7 +200,7 @@ class DataConfig:
         self.sources.append(DataSource(file=file, label=label))
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class OutputConfig:
     """Configuration for output settings."""
 
@@ -160,6 +210,9 @@ class OutputConfig:
 
     def __post_init__(self) -> None:
         """Validate output configuration after initialization."""
+        if _TRUSTED.get():
+            return
+
         valid_formats = ["png", "jpg", "jpeg", "svg", "pdf"]
         if self.format.lower() not in valid_formats:
             raise ValueError(
@@ -167,7 +220,7 @@ class OutputConfig:
             )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Config:
     """Main configuration class that matches the YAML structure."""
 
@@ -191,9 +244,11 @@ class Config:
             yaml.YAMLError: If the YAML is malformed
             ValueError: If the configuration is invalid
         """
-        parser = YAMLParser()
-        data = parser.load_file(file_path)
-        return cls.from_dict(data)
+        # The parsed file is cached until its mtime or size changes. It was
+        # validated when first loaded, so rebuilding from it skips the checks.
+        data = _load_config_data_cached(*file_cache_key(file_path))
+        with _trusted():
+            return cls.from_dict(data)
 
     @classmethod
     def from_yaml_string(cls, yaml_string: str) -> "Config":
@@ -228,82 +283,7 @@ class Config:
         Raises:
             ValueError: If the configuration is invalid
         """
-        # Extract graph configuration
-        graph_data = data.get("graph", {})
-        graph_config = GraphConfig(
-            title=graph_data.get("title", ""),
-            x_axis=AxisConfig(
-                label=graph_data.get("x_axis", {}).get("label", ""),
-                min=graph_data.get("x_axis", {}).get("min"),
-                max=graph_data.get("x_axis", {}).get("max"),
-            ),
-            y_axis=AxisConfig(
-                label=graph_data.get("y_axis", {}).get("label", ""),
-                min=graph_data.get("y_axis", {}).get("min"),
-                max=graph_data.get("y_axis", {}).get("max"),
-            ),
-            style=StyleConfig(
-                width=graph_data.get("style", {}).get("width", 10),
-                height=graph_data.get("style", {}).get("height", 10),
-                fonts=FontsConfig(
-                    title_size=graph_data.get("style", {})
-                    .get("fonts", {})
-                    .get("title_size", 16),
-                    label_size=graph_data.get("style", {})
-                    .get("fonts", {})
-                    .get("label_size", 12),
-                    legend_size=graph_data.get("style", {})
-                    .get("fonts", {})
-                    .get("legend_size", 10),
-                ),
-                grid=GridConfig(
-                    show=graph_data.get("style", {}).get("grid", {}).get("show", True),
-                ),
-                line_style=LineStyleConfig(
-                    markers=graph_data.get("style", {})
-                    .get("line_style", {})
-                    .get(
-                        "markers",
-                        ["o", "s", "^", "v", "<", ">", "p", "*", "+", "x", "D", "h"],
-                    ),
-                    line_styles=graph_data.get("style", {})
-                    .get("line_style", {})
-                    .get("line_styles", ["-", "--", "-.", ":"]),
-                    auto_cycle=graph_data.get("style", {})
-                    .get("line_style", {})
-                    .get("auto_cycle", True),
-                    line_width=graph_data.get("style", {})
-                    .get("line_style", {})
-                    .get("line_width", 2.0),
-                    marker_size=graph_data.get("style", {})
-                    .get("line_style", {})
-                    .get("marker_size", 6.0),
-                ),
-            ),
-        )
-
-        # Extract data configuration
-        data_config = DataConfig()
-        data_sources = data.get("data", {}).get("sources", [])
-        for source_data in data_sources:
-            data_config.add_source(
-                file=source_data.get("file", ""),
-                label=source_data.get("label"),
-            )
-
-        # Extract output configuration
-        output_data = data.get("output", {})
-        output_config = OutputConfig(
-            format=output_data.get("format", "png"),
-            dpi=output_data.get("dpi", 300),
-            save_path=output_data.get("save_path", "./output/graph.png"),
-        )
-
-        return cls(
-            graph=graph_config,
-            data=data_config,
-            output=output_config,
-        )
+        return _build(cls, data)
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -312,51 +292,7 @@ class Config:
         Returns:
             Dictionary representation of the configuration
         """
-        return {
-            "graph": {
-                "title": self.graph.title,
-                "x_axis": {
-                    "label": self.graph.x_axis.label,
-                    "min": self.graph.x_axis.min,
-                    "max": self.graph.x_axis.max,
-                },
-                "y_axis": {
-                    "label": self.graph.y_axis.label,
-                    "min": self.graph.y_axis.min,
-                    "max": self.graph.y_axis.max,
-                },
-                "style": {
-                    "width": self.graph.style.width,
-                    "height": self.graph.style.height,
-                    "fonts": {
-                        "title_size": self.graph.style.fonts.title_size,
-                        "label_size": self.graph.style.fonts.label_size,
-                        "legend_size": self.graph.style.fonts.legend_size,
-                    },
-                    "grid": {
-                        "show": self.graph.style.grid.show,
-                    },
-                    "line_style": {
-                        "markers": self.graph.style.line_style.markers,
-                        "line_styles": self.graph.style.line_style.line_styles,
-                        "auto_cycle": self.graph.style.line_style.auto_cycle,
-                        "line_width": self.graph.style.line_style.line_width,
-                        "marker_size": self.graph.style.line_style.marker_size,
-                    },
-                },
-            },
-            "data": {
-                "sources": [
-                    {"file": source.file, "label": source.label}
-                    for source in self.data.sources
-                ]
-            },
-            "output": {
-                "format": self.output.format,
-                "dpi": self.output.dpi,
-                "save_path": self.output.save_path,
-            },
-        }
+        return asdict(self)
 
     def validate(self) -> List[str]:
         """
@@ -397,3 +333,73 @@ class Config:
             True if valid, False otherwise
         """
         return len(self.validate()) == 0
+
+
+# Defaults applied when a YAML config omits a field, where they differ from the
+# dataclass defaults
+_YAML_DEFAULTS: Dict[type, Dict[str, Any]] = {
+    LineStyleConfig: {
+        "markers": ("o", "s", "^", "v", "<", ">", "p", "*", "+", "x", "D", "h"),
+        "line_styles": ("-", "--", "-.", ":"),
+    },
+}
+
+
+@lru_cache(maxsize=None)
+def _has_yaml_defaults(config_cls: type) -> bool:
+    """Check whether a config type, or any config nested in it, has YAML defaults."""
+    return config_cls in _YAML_DEFAULTS or any(
+        isinstance(config_field.type, type)
+        and is_dataclass(config_field.type)
+        and _has_yaml_defaults(config_field.type)
+        for config_field in fields(config_cls)
+    )
+
+
+def _build(config_cls: Type[T], data: Dict[str, Any]) -> T:
+    """
+    Recursively build a config dataclass from its YAML subtree.
+
+    Unknown keys are ignored. Nested configs that are missing from the input
+    fall back to their field defaults without being built from the dictionary.
+
+    Args:
+        config_cls: Dataclass type to build
+        data: Dictionary containing the data for that dataclass
+
+    Returns:
+        Instance of config_cls
+    """
+    kwargs: Dict[str, Any] = {
+        name: list(value) for name, value in _YAML_DEFAULTS.get(config_cls, {}).items()
+    }
+    for config_field in fields(config_cls):  # type: ignore[arg-type]
+        field_type = config_field.type
+        value = data.get(config_field.name)
+
+        if isinstance(field_type, type) and is_dataclass(field_type):
+            if value or _has_yaml_defaults(field_type):
+                kwargs[config_field.name] = _build(field_type, value or {})
+        elif get_origin(field_type) is list and is_dataclass(get_args(field_type)[0]):
+            item_cls = get_args(field_type)[0]
+            kwargs[config_field.name] = [_build(item_cls, item) for item in value or []]
+        elif config_field.name in data:
+            # Copy lists so configs never share them with the input data
+            kwargs[config_field.name] = (
+                list(value) if isinstance(value, list) else value
+            )
+
+    return config_cls(**kwargs)
+
+
+@lru_cache(maxsize=128)
+def _load_config_data_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Load and validate config data from a YAML file.
+
+    The result is shared between callers and must not be modified.
+    """
+    parser = YAMLParser()
+    data = parser.load_file(path, mutable=False)
+    Config.from_dict(data)  # raises ValueError if the config is invalid
+    return data
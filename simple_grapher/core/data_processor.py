@@ -2,11 +2,24 @@
 Data processing module for Simple Grapher.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import IO, Any, Dict, List, Optional, Union
 
 import pandas as pd
 
+# pyarrow's multithreaded CSV reader is used for numeric files when installed
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:
+    pa = None
+    pa_csv = None
+
+# Upper bound on the number of CSV files loaded at the same time
+MAX_LOAD_WORKERS = 8
+
 
 class DataProcessor:
     """Handles data loading and processing for graph creation."""
@@ -15,35 +28,89 @@ class DataProcessor:
         """Initialize the data processor."""
         pass
 
-    def load_csv(self, file_path: str) -> Optional[pd.DataFrame]:
+    def _read_csv_pyarrow(self, file_path: Union[str, Path]) -> Optional[pd.DataFrame]:
+        """
+        Read the first two columns of a CSV file with pyarrow.
+
+        Args:
+            file_path: Path to the CSV file
+
+        Returns:
+            pandas DataFrame with the first two columns, or None if the file
+            isn't a well-formed all-numeric CSV or pandas might infer different
+            column types, and it should go through pandas
+        """
+        with open(file_path, "rb") as f:
+            data = f.read()
+        # pyarrow parses hexadecimal integers, which pandas leaves as strings
+        if b"0x" in data or b"0X" in data:
+            return None
+
+        try:
+            # Column positions aren't accepted by pyarrow, so look the
+            # names up from the header before reading
+            with pa_csv.open_csv(pa.BufferReader(data)) as reader:
+                names = reader.schema.names
+            # Duplicate names would select the same column twice
+            if len(set(names[:2])) < 2:
+                return None
+
+            table = pa_csv.read_csv(
+                pa.BufferReader(data),
+                convert_options=pa_csv.ConvertOptions(include_columns=names[:2]),
+            )
+        except pa.ArrowInvalid:
+            # Empty files and ragged rows keep the pandas behaviour and messages
+            return None
+
+        # Leave strings, dates and the like to pandas' own type inference
+        if not all(
+            pa.types.is_integer(t) or pa.types.is_floating(t)
+            for t in table.schema.types
+        ):
+            return None
+
+        df = table.to_pandas()
+
+        # pyarrow reads integers with a sign or beyond int64 as floats, where
+        # pandas keeps them as integers or objects; a float column without
+        # missing or fractional values may be one of those
+        for column in df.columns:
+            values = df[column]
+            if (
+                values.dtype.kind == "f"
+                and not values.hasnans
+                and (values % 1 == 0).all()
+            ):
+                return None
+
+        return df
+
+    def load_csv(self, file_path: Union[str, Path, IO[str]]) -> Optional[pd.DataFrame]:
         """
         Load a CSV file and return a pandas DataFrame with x,y pairs.
         Uses the first two columns as x,y pairs regardless of column names.
 
         Args:
-            file_path: Path to the CSV file
+            file_path: Path to the CSV file, or a file-like object with CSV content
 
         Returns:
             pandas DataFrame with x,y columns (renamed to 'x' and 'y') or None if loading fails
         """
         try:
-            # Load the CSV file
-            df = pd.read_csv(file_path)
-
-            # Check if we have at least 2 columns
-            if len(df.columns) < 2:
-                raise ValueError(
-                    f"CSV file must have at least 2 columns, found {len(df.columns)}"
-                )
+            df = None
+            if pa_csv is not None and isinstance(file_path, (str, Path)):
+                df = self._read_csv_pyarrow(file_path)
 
-            # Use the first two columns as x,y pairs
-            x_column = df.columns[0]
-            y_column = df.columns[1]
+            if df is None:
+                # Only parse the first two columns; pandas raises a ValueError
+                # if the file has fewer than two
+                df = pd.read_csv(file_path, usecols=[0, 1], engine="c")
 
-            # Create a new DataFrame with just the first two columns, renamed to 'x' and 'y'
-            result_df = pd.DataFrame({"x": df[x_column], "y": df[y_column]})
+            # Rename the x,y pair in place rather than copying into a new frame
+            df.columns = ["x", "y"]
 
-            return result_df
+            return df
 
         except FileNotFoundError:
             print(f"Error: File '{file_path}' not found")
@@ -72,13 +139,21 @@ class DataProcessor:
             Dictionary mapping labels to DataFrames
         """
         dataframes: Dict[str, pd.DataFrame] = {}
+        sources = [source for source in sources if source.get("file")]
+        if not sources:
+            return dataframes
 
-        for source in sources:
-            file_path = source.get("file")
-            label = source.get("label", file_path)
+        # read_csv releases the GIL while parsing, so the files load concurrently
+        max_workers = min(MAX_LOAD_WORKERS, len(sources), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                self.load_csv, [source["file"] for source in sources]
+            )
+
+            for source, df in zip(sources, results):
+                file_path = source["file"]
+                label = source.get("label", file_path)
 
-            if file_path:
-                df = self.load_csv(file_path)
                 if df is not None:
                     dataframes[label] = df
                 else:
@@ -143,9 +218,14 @@ class DataProcessor:
             if "label" not in source:
                 errors.append(f"Source {i} missing required 'label' field")
 
-            # Check if file exists
-            file_path = Path(source["file"])
-            if not file_path.exists():
+            # One stat call covers both existence and the empty-file check
+            try:
+                file_size = os.stat(source["file"]).st_size
+            except OSError:
                 errors.append(f"Source {i} file '{source['file']}' not found")
+                continue
+
+            if file_size == 0:
+                errors.append(f"Source {i} file '{source['file']}' is empty")
 
         return errors
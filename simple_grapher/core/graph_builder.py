@@ -2,23 +2,390 @@
 Graph building module for Simple Grapher.
 """
 
+import copy
+import io
+import logging
+import os
+from functools import lru_cache
+from itertools import product
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-import matplotlib.pyplot as plt
+import matplotlib
+import numpy as np
 import pandas as pd
+from cycler import Cycler, cycler
+from matplotlib import rc_context, rcParams
 from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
 from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+
+logger = logging.getLogger(__name__)
+
+# Rendering settings for large series: simplify line paths more aggressively
+# and hand them to Agg in chunks, so big traces render faster and don't hit
+# Agg's path complexity limit
+RENDER_RC: Dict[Any, Any] = {
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+    "agg.path.chunksize": 10000,
+}
+
+# Values used by create_graph_from_config for keys missing from a config
+CONFIG_DEFAULTS: Dict[str, Any] = {
+    "graph": {
+        "type": "line",
+        "title": "Graph",
+        "x_axis": {"label": "X"},
+        "y_axis": {"label": "Y"},
+        "style": {},
+    },
+    "data": {"sources": []},
+}
+
+# Line graphs with at least this many sources are drawn as one LineCollection
+LINE_COLLECTION_MIN_SOURCES = 16
+
+# Points kept per horizontal pixel when downsampling is enabled
+DOWNSAMPLE_POINTS_PER_PIXEL = 4
+
+# Figures kept by a reusing GraphBuilder, one per figure size
+FIGURE_POOL_SIZE = 4
+
+
+def _merge_defaults(config: Dict[str, Any], defaults: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of config with keys missing from it filled in from defaults."""
+    merged = dict(config)
+    for key, default in defaults.items():
+        if isinstance(default, dict):
+            value = config.get(key)
+            merged[key] = _merge_defaults(
+                value if isinstance(value, dict) else {}, default
+            )
+        elif key not in merged:
+            merged[key] = copy.copy(default)
+    return merged
+
+
+def _file_matches(path: Path, content: memoryview) -> bool:
+    """Check whether the file at path exists and holds exactly content."""
+    try:
+        if os.path.getsize(path) != len(content):
+            return False
+        with open(path, "rb") as file:
+            return file.read() == content
+    except OSError:
+        return False
+
+
+def _normalize_sources(
+    data_sources: List[Dict[str, Any]],
+) -> Tuple[List[str], List[Any], List[Any]]:
+    """
+    Validate data sources and pull out their labels and x,y arrays.
+
+    Args:
+        data_sources: List of data source dictionaries with a 'label' key and
+            either a 'dataframe' key or 'x' and 'y' array keys
+
+    Returns:
+        Tuple of (labels, x arrays, y arrays) for the usable sources
+    """
+    labels: List[str] = []
+    xs: List[Any] = []
+    ys: List[Any] = []
+
+    for source in data_sources:
+        has_data = "dataframe" in source or ("x" in source and "y" in source)
+        if not has_data or "label" not in source:
+            logger.warning("Skipping source missing 'dataframe' or 'label': %s", source)
+            continue
+
+        label = source["label"]
+
+        if "dataframe" in source:
+            df = source["dataframe"]
+
+            if not isinstance(df, pd.DataFrame):
+                logger.warning("Skipping source with invalid dataframe: %s", label)
+                continue
+
+            if df.empty:
+                logger.warning("Skipping empty dataframe: %s", label)
+                continue
+
+            # Get x and y columns (assume first two columns are x,y)
+            # as arrays once, rather than a Series per plot call
+            x_data = df.iloc[:, 0].to_numpy(copy=False)
+            y_data = df.iloc[:, 1].to_numpy(copy=False)
+        else:
+            x_data = np.asarray(source["x"])
+            y_data = np.asarray(source["y"])
+
+            if x_data.size == 0:
+                logger.warning("Skipping empty data: %s", label)
+                continue
+
+        # Columns of a frame or array built from a 2D row-major block are
+        # strided views; give Agg one contiguous array per column instead
+        x_data = np.ascontiguousarray(x_data)
+        y_data = np.ascontiguousarray(y_data)
+
+        labels.append(label)
+        xs.append(x_data)
+        ys.append(y_data)
+
+    return labels, xs, ys
+
+
+def _lttb_downsample(
+    x: np.ndarray, y: np.ndarray, n_out: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Downsample a series with the Largest-Triangle-Three-Buckets algorithm.
+
+    The first and last points are always kept. The points in between are split
+    into n_out - 2 buckets, and from each bucket the point forming the largest
+    triangle with the previously kept point and the mean of the next bucket is
+    kept, which preserves the visual shape of the series.
+
+    Args:
+        x: Numeric x values
+        y: Numeric y values
+        n_out: Number of points to keep
+
+    Returns:
+        Tuple of downsampled (x, y) arrays; the inputs are returned unchanged
+        if they already have n_out points or fewer, or if n_out is less than 3
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return x, y
+
+    x_float = np.asarray(x, dtype=float)
+    y_float = np.asarray(y, dtype=float)
+
+    # Edges of the n_out - 2 buckets covering the interior points [1, n - 1)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    keep = np.empty(n_out, dtype=np.intp)
+    keep[0] = 0
+    keep[-1] = n - 1
+
+    prev = 0
+    for bucket in range(n_out - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+
+        # The last bucket looks ahead to the final point only
+        if bucket + 2 < len(edges):
+            next_start, next_end = end, edges[bucket + 2]
+        else:
+            next_start, next_end = n - 1, n
+        next_x = x_float[next_start:next_end].mean()
+        next_y = y_float[next_start:next_end].mean()
+
+        # Twice the triangle area; the constant factor doesn't change the argmax
+        prev_x, prev_y = x_float[prev], y_float[prev]
+        area = np.abs(
+            (prev_x - next_x) * (y_float[start:end] - prev_y)
+            - (prev_x - x_float[start:end]) * (next_y - prev_y)
+        )
+        prev = start + int(np.argmax(area))
+        keep[bucket + 1] = prev
+
+    return x[keep], y[keep]
+
+
+def _maybe_downsample(x: Any, y: Any, target: int) -> Tuple[Any, Any]:
+    """Downsample numeric x,y data to target points if it has more than that."""
+    if len(x) <= target:
+        return x, y
+
+    x_arr = np.asarray(x)
+    y_arr = np.asarray(y)
+    if not (
+        np.issubdtype(x_arr.dtype, np.number) and np.issubdtype(y_arr.dtype, np.number)
+    ):
+        return x, y
+
+    return _lttb_downsample(x_arr, y_arr, target)
+
+
+@lru_cache(maxsize=32)
+def _build_cycler(markers: Tuple[str, ...], line_styles: Tuple[str, ...]) -> Cycler:
+    """Build the auto-cycle property cycler for a set of markers and line styles."""
+    # If no markers specified, just cycle through line styles
+    if not markers:
+        return cycler(linestyle=list(line_styles))
+
+    # Create all combinations of markers and line styles
+    combined_markers, combined_line_styles = zip(*product(markers, line_styles))
+    return cycler(marker=list(combined_markers), linestyle=list(combined_line_styles))
+
+
+def _make_plotter(
+    ax: Axes, graph_type: str, style_config: Optional[Any]
+) -> Callable[[int, str, Any, Any], None]:
+    """
+    Build the function that plots one data source onto an axis.
+
+    Args:
+        ax: Axis to plot onto
+        graph_type: Type of graph to create (line, bar, scatter)
+        style_config: StyleConfig object for styling options
+
+    Returns:
+        Function taking a source's index, label, x data and y data
+    """
+    line_style = style_config.line_style if style_config else None
+    markers = line_style.markers if line_style else []
+    line_styles = line_style.line_styles if line_style else []
+
+    if graph_type == "bar":
+
+        def plot(i: int, label: str, x_data: Any, y_data: Any) -> None:
+            ax.bar(x_data, y_data, label=label, alpha=0.7)
+
+    elif graph_type == "scatter":
+        size = line_style.marker_size**2 if line_style else 36
+
+        def plot(i: int, label: str, x_data: Any, y_data: Any) -> None:
+            # Use marker from style config if available, else a circle
+            marker = markers[i % len(markers)] if markers else "o"
+            ax.scatter(x_data, y_data, label=label, alpha=0.7, marker=marker, s=size)
+
+    elif line_style and line_style.auto_cycle:
+        # Let the axis' cycler handle marker and line style
+        line_kwargs = {
+            "linewidth": line_style.line_width,
+            "markersize": line_style.marker_size,
+        }
+
+        def plot(i: int, label: str, x_data: Any, y_data: Any) -> None:
+            ax.plot(x_data, y_data, label=label, **line_kwargs)
+
+    else:
+        # Manual selection of marker and line style
+        linewidth = line_style.line_width if line_style else 2
+        markersize = line_style.marker_size if line_style else 6
+
+        def plot(i: int, label: str, x_data: Any, y_data: Any) -> None:
+            plot_kwargs: Dict[str, Any] = {
+                "label": label,
+                "linestyle": line_styles[i % len(line_styles)] if line_styles else "-",
+                "linewidth": linewidth,
+            }
+            # Only add marker parameter if we have markers
+            if markers:
+                plot_kwargs["marker"] = markers[i % len(markers)]
+                plot_kwargs["markersize"] = markersize
+            ax.plot(x_data, y_data, **plot_kwargs)
+
+    return plot
+
+
+def _plot_line_collection(
+    ax: Axes,
+    labels: List[str],
+    xs: List[Any],
+    ys: List[Any],
+    style_config: Optional[Any],
+) -> Optional[List[Line2D]]:
+    """
+    Plot line sources as a single LineCollection instead of a Line2D each.
+
+    Only marker-less, manually styled lines with numeric data are batched, and
+    only when they are all solid or all dashed, since Line2D caps solid and
+    dashed lines differently and a collection has one cap style. The result
+    draws the same as per-source lines.
+
+    Args:
+        ax: Axis to plot onto
+        labels: Source labels
+        xs: Source x arrays
+        ys: Source y arrays
+        style_config: StyleConfig object for styling options
+
+    Returns:
+        Legend handles for the sources, or None if they weren't plotted
+    """
+    line_style = style_config.line_style if style_config else None
+    if len(labels) < LINE_COLLECTION_MIN_SOURCES or (
+        line_style and (line_style.auto_cycle or line_style.markers)
+    ):
+        return None
+
+    if not all(
+        np.issubdtype(data.dtype, np.number) and not np.issubdtype(data.dtype, np.bool_)
+        for data in (*xs, *ys)
+    ):
+        return None
+
+    line_styles = line_style.line_styles if line_style else []
+    linestyles: List[Any] = [
+        line_styles[i % len(line_styles)] if line_styles else "-"
+        for i in range(len(labels))
+    ]
+    solid = {linestyle == "-" for linestyle in linestyles}
+    if len(solid) > 1:
+        return None
+    capstyle, joinstyle = (
+        (rcParams["lines.solid_capstyle"], rcParams["lines.solid_joinstyle"])
+        if solid.pop()
+        else (rcParams["lines.dash_capstyle"], rcParams["lines.dash_joinstyle"])
+    )
+
+    # Colors follow the axis' default property cycle, as separate lines would
+    cycle_colors = rcParams["axes.prop_cycle"].by_key().get("color", ["C0"])
+    colors = [cycle_colors[i % len(cycle_colors)] for i in range(len(labels))]
+    linewidth = line_style.line_width if line_style else 2
+
+    collection = LineCollection(
+        [np.column_stack((x_data, y_data)) for x_data, y_data in zip(xs, ys)],
+        colors=colors,
+        linestyles=linestyles,
+        linewidths=linewidth,
+        capstyle=capstyle,
+        joinstyle=joinstyle,
+    )
+    ax.add_collection(collection)
+
+    # Legend placement only avoids Line2D data, so add one hidden line through
+    # every source (NaN-separated) for loc="best" to steer around
+    guide_x = np.concatenate([np.append(x_data, np.nan) for x_data in xs])
+    guide_y = np.concatenate([np.append(y_data, np.nan) for y_data in ys])
+    ax.add_line(Line2D(guide_x, guide_y, visible=False, label="_nolegend_"))
+    ax.autoscale_view()
+
+    return [
+        Line2D(
+            [], [], color=color, linestyle=linestyle, linewidth=linewidth, label=label
+        )
+        for label, color, linestyle in zip(labels, colors, linestyles)
+    ]
 
 
 class GraphBuilder:
     """Handles graph creation and customization."""
 
-    def __init__(self) -> None:
-        """Initialize the graph builder."""
-        self.supported_types = ["line", "bar", "scatter"]
+    def __init__(self, reuse_figure: bool = False) -> None:
+        """
+        Initialize the graph builder.
+
+        Args:
+            reuse_figure: Reuse figures across create_graph calls (clearing their
+                axis in between) instead of creating a new figure each time. One
+                figure is kept per figure size, for up to FIGURE_POOL_SIZE sizes.
+                Figures returned earlier are overwritten by later calls of the
+                same size.
+        """
+        self.supported_types = ("line", "bar", "scatter")
+        self._supported_set = frozenset(self.supported_types)
+        self.reuse_figure = reuse_figure
         self.fig: Optional[Figure] = None
         self.ax: Optional[Axes] = None
+        self._figure_pool: Dict[Tuple[float, float], Tuple[Figure, Axes]] = {}
 
     def create_graph(
         self,
@@ -28,12 +395,13 @@ class GraphBuilder:
         x_label: str = "X",
         y_label: str = "Y",
         style_config: Optional[Any] = None,
-    ) -> Optional[plt.Figure]:
+    ) -> Optional[Figure]:
         """
         Create a graph from a list of data sources.
 
         Args:
-            data_sources: List of data source dictionaries with 'dataframe' and 'label' keys
+            data_sources: List of data source dictionaries with a 'label' key and
+                either a 'dataframe' key or 'x' and 'y' array keys
             graph_type: Type of graph to create (line, bar, scatter)
             title: Graph title
             x_label: X-axis label
@@ -43,164 +411,103 @@ class GraphBuilder:
         Returns:
             matplotlib Figure object or None if creation fails
         """
-        if graph_type not in self.supported_types:
-            print(
-                f"Error: Unsupported graph type '{graph_type}'. Supported types: {self.supported_types}"
+        if graph_type not in self._supported_set:
+            logger.error(
+                "Unsupported graph type '%s'. Supported types: %s",
+                graph_type,
+                list(self.supported_types),
             )
             return None
 
         if not data_sources:
-            print("Error: No data sources provided")
+            logger.error("No data sources provided")
             return None
 
         try:
-            # Create figure and axis
-            figsize = (10, 6)
-            if style_config:
-                figsize = (style_config.width, style_config.height)
-            self.fig, self.ax = plt.subplots(figsize=figsize)
-
-            # Set up line style cycling if auto_cycle is enabled
-            if (
-                style_config
-                and style_config.line_style.auto_cycle
-                and graph_type == "line"
-            ):
-                from cycler import cycler
-
-                markers = style_config.line_style.markers
-                line_styles = style_config.line_style.line_styles
-
-                # If no markers specified, just cycle through line styles
-                if not markers:
-                    # Just cycle through line styles with no markers
-                    custom_cycler = cycler(linestyle=line_styles)
+            # Path settings are read when lines are added, so apply them here
+            with rc_context(RENDER_RC):
+                # Create figure and axis
+                figsize = (10, 6)
+                if style_config:
+                    figsize = (style_config.width, style_config.height)
+                pool_key = (float(figsize[0]), float(figsize[1]))
+                if self.reuse_figure and pool_key in self._figure_pool:
+                    self.fig, self.ax = self._figure_pool[pool_key]
+                    self.ax.clear()
                 else:
-                    # Create all combinations of markers and line styles
-                    combined_styles = []
-                    for marker in markers:
-                        for line_style in line_styles:
-                            combined_styles.append((marker, line_style))
-
-                    # Create cycler with combined styles
-                    custom_cycler = cycler(
-                        marker=[style[0] for style in combined_styles],
-                        linestyle=[style[1] for style in combined_styles],
+                    # Render straight to an Agg canvas; going through pyplot would
+                    # select a GUI backend and keep every figure in its global
+                    # registry
+                    self.fig = Figure(figsize=figsize)
+                    FigureCanvasAgg(self.fig)
+                    self.ax = self.fig.subplots()
+                    if self.reuse_figure:
+                        if len(self._figure_pool) >= FIGURE_POOL_SIZE:
+                            # Drop the size that was pooled first
+                            del self._figure_pool[next(iter(self._figure_pool))]
+                        self._figure_pool[pool_key] = (self.fig, self.ax)
+
+                # Set up line style cycling if auto_cycle is enabled
+                if (
+                    style_config
+                    and style_config.line_style.auto_cycle
+                    and graph_type == "line"
+                ):
+                    custom_cycler = _build_cycler(
+                        tuple(style_config.line_style.markers),
+                        tuple(style_config.line_style.line_styles),
                     )
 
-                if self.ax is not None:
-                    self.ax.set_prop_cycle(custom_cycler)
-
-            # Plot each data source
-            if self.ax is None:
-                print("Error: No axis available for plotting")
-                return
-
-            for i, source in enumerate(data_sources):
-                if "dataframe" not in source or "label" not in source:
-                    print(
-                        f"Warning: Skipping source missing 'dataframe' or 'label': {source}"
+                    if self.ax is not None:
+                        self.ax.set_prop_cycle(custom_cycler)
+
+                # Plot each data source
+                if self.ax is None:
+                    logger.error("No axis available for plotting")
+                    return
+
+                labels, xs, ys = _normalize_sources(data_sources)
+                if (
+                    style_config
+                    and style_config.downsample
+                    and graph_type in ("line", "scatter")
+                ):
+                    target = int(
+                        style_config.width * self.fig.dpi * DOWNSAMPLE_POINTS_PER_PIXEL
                     )
-                    continue
+                    for i, (x_data, y_data) in enumerate(zip(xs, ys)):
+                        xs[i], ys[i] = _maybe_downsample(x_data, y_data, target)
 
-                df = source["dataframe"]
-                label = source["label"]
-
-                if not isinstance(df, pd.DataFrame):
-                    print(f"Warning: Skipping source with invalid dataframe: {label}")
-                    continue
-
-                if df.empty:
-                    print(f"Warning: Skipping empty dataframe: {label}")
-                    continue
-
-                # Get x and y columns (assume first two columns are x,y)
-                x_col = df.columns[0]
-                y_col = df.columns[1]
-
-                # Plot based on graph type
+                # Plain lines are drawn as one collection; anything else, or
+                # lines that can't be batched, is plotted source by source
+                legend_handles = None
                 if graph_type == "line":
-                    # Use style configuration if available
-                    if style_config and style_config.line_style.auto_cycle:
-                        # Let cycler handle marker and line style
-                        self.ax.plot(
-                            df[x_col],
-                            df[y_col],
-                            label=label,
-                            linewidth=style_config.line_style.line_width,
-                            markersize=style_config.line_style.marker_size,
-                        )
-                    else:
-                        # Manual selection of marker and line style
-                        marker = None  # Default to no marker
-                        linestyle = "-"
-                        if style_config and style_config.line_style.markers:
-                            marker = style_config.line_style.markers[
-                                i % len(style_config.line_style.markers)
-                            ]
-                        if style_config and style_config.line_style.line_styles:
-                            linestyle = style_config.line_style.line_styles[
-                                i % len(style_config.line_style.line_styles)
-                            ]
-
-                        # Only add marker parameter if we have markers
-                        plot_kwargs = {
-                            "label": label,
-                            "linestyle": linestyle,
-                            "linewidth": (
-                                style_config.line_style.line_width
-                                if style_config
-                                else 2
-                            ),
-                        }
-                        if marker is not None:
-                            plot_kwargs["marker"] = marker
-                            plot_kwargs["markersize"] = (
-                                style_config.line_style.marker_size
-                                if style_config
-                                else 6
-                            )
-
-                        self.ax.plot(df[x_col], df[y_col], **plot_kwargs)
-                elif graph_type == "bar":
-                    self.ax.bar(df[x_col], df[y_col], label=label, alpha=0.7)
-                elif graph_type == "scatter":
-                    # Use marker from style config if available
-                    marker = "o"  # Default marker for scatter plots
-                    if style_config and style_config.line_style.markers:
-                        marker = style_config.line_style.markers[
-                            i % len(style_config.line_style.markers)
-                        ]
-                    elif style_config and not style_config.line_style.markers:
-                        # If no markers specified, use default circle
-                        marker = "o"
-                    self.ax.scatter(
-                        df[x_col],
-                        df[y_col],
-                        label=label,
-                        alpha=0.7,
-                        marker=marker,
-                        s=(
-                            style_config.line_style.marker_size**2
-                            if style_config
-                            else 36
-                        ),
+                    legend_handles = _plot_line_collection(
+                        self.ax, labels, xs, ys, style_config
                     )
+                if legend_handles is None:
+                    # Resolve style lookups once rather than per source
+                    plot_source = _make_plotter(self.ax, graph_type, style_config)
+                    for i, (label, x_data, y_data) in enumerate(zip(labels, xs, ys)):
+                        plot_source(i, label, x_data, y_data)
+
+                # Customize the plot
+                self.ax.set_title(title, fontsize=16, fontweight="bold")
+                self.ax.set_xlabel(x_label, fontsize=12)
+                self.ax.set_ylabel(y_label, fontsize=12)
+                if legend_handles is not None:
+                    self.ax.legend(handles=legend_handles)
+                else:
+                    self.ax.legend()
+                self.ax.grid(True, alpha=0.3)
 
-            # Customize the plot
-            self.ax.set_title(title, fontsize=16, fontweight="bold")
-            self.ax.set_xlabel(x_label, fontsize=12)
-            self.ax.set_ylabel(y_label, fontsize=12)
-            self.ax.legend()
-            self.ax.grid(True, alpha=0.3)
-
-            # Adjust layout
-            plt.tight_layout()
+                # Adjust layout
+                self.fig.tight_layout()
 
-            return self.fig
+                return self.fig
 
         except Exception as e:
-            print(f"Error creating graph: {e}")
+            logger.error("Error creating graph: %s", e)
             return None
 
     def create_graph_from_dataframes(
@@ -211,7 +518,7 @@ class GraphBuilder:
         x_label: str = "X",
         y_label: str = "Y",
         style_config: Optional[Any] = None,
-    ) -> Optional[plt.Figure]:
+    ) -> Optional[Figure]:
         """
         Create a graph from a dictionary of DataFrames.
 
@@ -235,9 +542,42 @@ class GraphBuilder:
             data_sources, graph_type, title, x_label, y_label, style_config
         )
 
+    def create_graph_from_arrays(
+        self,
+        arrays: Dict[str, Tuple[np.ndarray, np.ndarray]],
+        graph_type: str = "line",
+        title: str = "Graph",
+        x_label: str = "X",
+        y_label: str = "Y",
+        style_config: Optional[Any] = None,
+    ) -> Optional[Figure]:
+        """
+        Create a graph from a dictionary of (x, y) arrays.
+
+        Avoids wrapping data that is already in arrays in a DataFrame per series.
+
+        Args:
+            arrays: Dictionary mapping labels to (x, y) array pairs
+            graph_type: Type of graph to create
+            title: Graph title
+            x_label: X-axis label
+            y_label: Y-axis label
+            style_config: StyleConfig object for styling options
+
+        Returns:
+            matplotlib Figure object or None if creation fails
+        """
+        data_sources = [
+            {"x": x, "y": y, "label": label} for label, (x, y) in arrays.items()
+        ]
+
+        return self.create_graph(
+            data_sources, graph_type, title, x_label, y_label, style_config
+        )
+
     def create_graph_from_config(
         self, config: Dict[str, Any], data_processor: Any
-    ) -> Optional[plt.Figure]:
+    ) -> Optional[Figure]:
         """
         Create a graph from a complete configuration dictionary.
 
@@ -251,46 +591,39 @@ class GraphBuilder:
         if not isinstance(config, dict):
             return None
 
-        # Extract graph configuration
-        graph_config = config.get("graph", {})
-        graph_type = graph_config.get("type", "line")
-        title = graph_config.get("title", "Graph")
-
-        # Extract axis labels
-        x_axis = graph_config.get("x_axis", {})
-        y_axis = graph_config.get("y_axis", {})
-        x_label = x_axis.get("label", "X")
-        y_label = y_axis.get("label", "Y")
-
-        # Extract style configuration
-        style_config = graph_config.get("style", {})
-
-        # Extract data sources
-        data_config = config.get("data", {})
-        sources = data_config.get("sources", [])
+        # Fill in defaults for any missing keys in one pass
+        config = _merge_defaults(config, CONFIG_DEFAULTS)
+        graph_config = config["graph"]
+        sources = config["data"]["sources"]
 
         if not sources:
-            print("Error: No data sources found in configuration")
+            logger.error("No data sources found in configuration")
             return None
 
         # Load data from sources
         dataframes = data_processor.load_multiple_csvs(sources)
 
         if not dataframes:
-            print("Error: Failed to load any data from sources")
+            logger.error("Failed to load any data from sources")
             return None
 
         # Create the graph
         return self.create_graph_from_dataframes(
-            dataframes, graph_type, title, x_label, y_label, style_config
+            dataframes,
+            graph_config["type"],
+            graph_config["title"],
+            graph_config["x_axis"]["label"],
+            graph_config["y_axis"]["label"],
+            graph_config["style"],
         )
 
     def save_graph(
         self,
-        figure: plt.Figure,
+        figure: Figure,
         output_path: Union[str, Path],
         dpi: int = 300,
         format: Optional[str] = None,
+        skip_unchanged: bool = False,
     ) -> bool:
         """
         Save the graph to a file.
@@ -300,12 +633,14 @@ class GraphBuilder:
             output_path: Path where to save the graph
             dpi: DPI for the output image
             format: Output format (png, pdf, svg, etc.). If None, inferred from file extension
+            skip_unchanged: Leave the existing file alone when it already holds
+                exactly the rendered image
 
         Returns:
             True if successful, False otherwise
         """
         if figure is None:
-            print("Error: No figure to save")
+            logger.error("No figure to save")
             return False
 
         output_path = Path(output_path)
@@ -320,15 +655,36 @@ class GraphBuilder:
                 if not format:
                     format = "png"  # Default to PNG
 
-            # Save the figure
-            figure.savefig(output_path, dpi=dpi, format=format, bbox_inches="tight")
-            print(f"Graph saved to: {output_path}")
+            # Render in memory first (Agg reads the chunk size at draw time), so
+            # a failed save never truncates an existing graph; the encoded image
+            # then reaches disk in a single write
+            buffer = io.BytesIO()
+            with rc_context(RENDER_RC):
+                figure.savefig(buffer, dpi=dpi, format=format, bbox_inches="tight")
+            image = buffer.getbuffer()
+
+            if skip_unchanged and _file_matches(output_path, image):
+                logger.info("Graph unchanged, skipped saving: %s", output_path)
+                return True
+
+            output_path.write_bytes(image)
+            logger.info("Graph saved to: %s", output_path)
             return True
 
         except Exception as e:
-            print(f"Error saving graph: {e}")
+            logger.error("Error saving graph: %s", e)
             return False
 
+    def close(self) -> None:
+        """Clear the current and pooled figures and drop the builder's references."""
+        if self.fig is not None:
+            self.fig.clear()
+        for figure, _ in self._figure_pool.values():
+            figure.clear()
+        self._figure_pool.clear()
+        self.fig = None
+        self.ax = None
+
     def get_supported_types(self) -> List[str]:
         """
         Get list of supported graph types.
@@ -336,7 +692,7 @@ class GraphBuilder:
         Returns:
             List of supported graph type strings
         """
-        return self.supported_types.copy()
+        return list(self.supported_types)
 
     def validate_graph_type(self, graph_type: str) -> bool:
         """
@@ -348,4 +704,4 @@ class GraphBuilder:
         Returns:
             True if supported, False otherwise
         """
-        return graph_type in self.supported_types
+        return graph_type in self._supported_set
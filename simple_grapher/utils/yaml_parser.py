@@ -5,11 +5,78 @@ This module provides utilities for parsing YAML configuration files
 and data files for graph creation.
 """
 
+import copy
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import yaml
 
+# Prefer the libyaml-backed loader and dumper when PyYAML was built with them;
+# the pure Python SafeLoader/SafeDumper behave the same, only slower.
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+# JSON configs skip YAML parsing entirely; orjson is used when installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads  # type: ignore[assignment]
+
+
+def file_cache_key(file_path: Union[str, Path]) -> Tuple[str, int, int]:
+    """
+    Build a cache key that changes whenever the file on disk changes.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Tuple of (absolute path, modification time in ns, size in bytes)
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"YAML file not found: {file_path}")
+    return os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=128)
+def _load_file_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a YAML file; results are shared, so callers must copy them."""
+    with open(path, "r", encoding="utf-8") as file:
+        data = yaml.load(file, Loader=_SafeLoader)
+    if not isinstance(data, dict):
+        raise yaml.YAMLError(f"YAML file {path} does not contain a dictionary")
+    return data
+
+
+@lru_cache(maxsize=256)
+def _split_path(key_path: str) -> Tuple[str, ...]:
+    """Split a dot-separated key path into its keys."""
+    return tuple(key_path.split("."))
+
+
+def _load_json_file(file_path: Union[str, Path]) -> Dict[str, Any]:
+    """Parse a JSON config file, which must contain an object."""
+    with open(file_path, "rb") as file:
+        content = file.read()
+    try:
+        data = _json_loads(content)
+    except ValueError as e:
+        raise ValueError(f"Error parsing JSON file {file_path}: {e}")
+    if not isinstance(data, dict):
+        raise ValueError(f"JSON file {file_path} does not contain an object")
+    return data
+
 
 class YAMLParser:
     """Handles YAML file parsing and validation."""
@@ -18,12 +85,16 @@ class YAMLParser:
         """Initialize the YAML parser."""
         self.data: Optional[Dict[str, Any]] = None
 
-    def load_file(self, file_path: Union[str, Path]) -> Dict[str, Any]:
+    def load_file(
+        self, file_path: Union[str, Path], mutable: bool = True
+    ) -> Dict[str, Any]:
         """
         Load and parse a YAML file.
 
         Args:
             file_path: Path to the YAML file
+            mutable: If False, return the cached parse result itself instead of
+                a copy; callers must then treat it as read-only
 
         Returns:
             Parsed YAML data as a dictionary
@@ -33,19 +104,13 @@ class YAMLParser:
             yaml.YAMLError: If the YAML is malformed
         """
         file_path = Path(file_path)
-
-        if not file_path.exists():
-            raise FileNotFoundError(f"YAML file not found: {file_path}")
+        cache_key = file_cache_key(file_path)
 
         try:
-            with open(file_path, "r", encoding="utf-8") as file:
-                data = yaml.safe_load(file)
-                if not isinstance(data, dict):
-                    raise yaml.YAMLError(
-                        f"YAML file {file_path} does not contain a dictionary"
-                    )
-                self.data = data
-                return self.data
+            # Parsed files are cached until their mtime or size changes
+            data = _load_file_cached(*cache_key)
+            self.data = copy.deepcopy(data) if mutable else data
+            return self.data
         except yaml.YAMLError as e:
             raise yaml.YAMLError(f"Error parsing YAML file {file_path}: {e}")
 
@@ -63,7 +128,7 @@ class YAMLParser:
             yaml.YAMLError: If the YAML is malformed
         """
         try:
-            data = yaml.safe_load(yaml_string)
+            data = yaml.load(yaml_string, Loader=_SafeLoader)
             if not isinstance(data, dict):
                 raise yaml.YAMLError("YAML string does not contain a dictionary")
             self.data = data
@@ -82,15 +147,42 @@ class YAMLParser:
         file_path = Path(file_path)
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # Keys are written in insertion order, which also skips sorting every
+        # mapping before it is dumped
         with open(file_path, "w", encoding="utf-8") as file:
-            yaml.dump(data, file, default_flow_style=False, indent=2)
-
-    def get_value(self, key_path: str, default: Any = None) -> Any:
+            yaml.dump(
+                data,
+                file,
+                Dumper=_SafeDumper,
+                default_flow_style=False,
+                indent=2,
+                sort_keys=False,
+            )
+
+    def get_value(
+        self, key_path: Union[str, Tuple[str, ...]], default: Any = None
+    ) -> Any:
         """
         Get a value from the loaded data using dot notation.
 
         Args:
-            key_path: Dot-separated path to the value (e.g., 'config.graph.title')
+            key_path: Dot-separated path to the value (e.g., 'config.graph.title'),
+                or a tuple of keys (e.g., ('config', 'graph', 'title'))
+            default: Default value if key not found
+
+        Returns:
+            The value at the specified path or default
+        """
+        if isinstance(key_path, str):
+            key_path = _split_path(key_path)
+        return self.get_value_path(key_path, default)
+
+    def get_value_path(self, key_path: Tuple[str, ...], default: Any = None) -> Any:
+        """
+        Get a value from the loaded data using a pre-split key path.
+
+        Args:
+            key_path: Tuple of keys leading to the value (e.g., ('graph', 'title'))
             default: Default value if key not found
 
         Returns:
@@ -99,22 +191,21 @@ class YAMLParser:
         if self.data is None:
             return default
 
-        keys = key_path.split(".")
         value = self.data
 
         try:
-            for key in keys:
+            for key in key_path:
                 value = value[key]
             return value
         except (KeyError, TypeError):
             return default
 
-    def validate_schema(self, required_keys: List[str]) -> bool:
+    def validate_schema(self, required_keys: List[Union[str, Tuple[str, ...]]]) -> bool:
         """
         Validate that the loaded data contains required keys.
 
         Args:
-            required_keys: List of required key paths
+            required_keys: List of required key paths, dot-separated or pre-split
 
         Returns:
             True if all required keys are present, False otherwise
@@ -122,23 +213,29 @@ class YAMLParser:
         if self.data is None:
             return False
 
-        for key_path in required_keys:
-            if self.get_value(key_path) is None:
-                return False
-
-        return True
+        return all(self.get_value(key_path) is not None for key_path in required_keys)
 
 
 def parse_config_file(file_path: Union[str, Path]) -> Dict[str, Any]:
     """
     Convenience function to parse a YAML config file.
 
+    Files with a .json suffix are parsed as JSON instead, which is faster.
+
     Args:
-        file_path: Path to the YAML config file
+        file_path: Path to the YAML or JSON config file
 
     Returns:
         Parsed configuration data
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        yaml.YAMLError: If the YAML is malformed
+        ValueError: If the JSON is malformed
     """
+    if Path(file_path).suffix.lower() == ".json":
+        return _load_json_file(file_path)
+
     parser = YAMLParser()
     return parser.load_file(file_path)
 
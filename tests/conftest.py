@@ -0,0 +1,46 @@
+"""
+Shared pytest fixtures.
+"""
+
+import matplotlib
+import pytest
+
+# Select the non-interactive backend before any test module imports pyplot
+matplotlib.use("Agg")
+
+from matplotlib import font_manager  # noqa: E402
+
+# Build (or load) the font list and resolve the default font once per process,
+# including each xdist worker, rather than inside whichever test draws first
+font_manager.findfont(font_manager.FontProperties())
+
+
+def _write_csv(tmp_path_factory, name, content):
+    """Write CSV content to a new file in a session temp directory."""
+    path = tmp_path_factory.mktemp("csv") / name
+    path.write_text(content)
+    return path
+
+
+@pytest.fixture(scope="session")
+def xy_csv(tmp_path_factory):
+    """CSV file with three x,y rows. Shared by the session; don't modify it."""
+    return _write_csv(tmp_path_factory, "xy.csv", "x,y\n1,2\n3,4\n5,6\n")
+
+
+@pytest.fixture(scope="session")
+def time_value_csv(tmp_path_factory):
+    """CSV file with three time,value rows. Shared by the session; don't modify it."""
+    return _write_csv(tmp_path_factory, "time_value.csv", "time,value\n1,2\n3,4\n5,6\n")
+
+
+@pytest.fixture(scope="session")
+def small_xy_csv(tmp_path_factory):
+    """CSV file with two x,y rows. Shared by the session; don't modify it."""
+    return _write_csv(tmp_path_factory, "small_xy.csv", "x,y\n1,2\n3,4\n")
+
+
+@pytest.fixture(scope="session")
+def other_xy_csv(tmp_path_factory):
+    """A second two-row x,y CSV file. Shared by the session; don't modify it."""
+    return _write_csv(tmp_path_factory, "other_xy.csv", "x,y\n5,6\n7,8\n")
@@ -6,9 +6,10 @@ import argparse
 import os
 import sys
 import tempfile
-import unittest
 from unittest.mock import patch
 
+import pytest
+
 # Add the parent directory to the path to import the module
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -20,19 +21,19 @@ from simple_grapher.cli import (  # noqa: E402
 )
 
 
-class TestCLI(unittest.TestCase):
+class TestCLI:
     """Test cases for CLI functionality."""
 
     def test_parser_creation(self):
         """Test argument parser creation."""
         parser = create_parser()
-        self.assertIsInstance(parser, argparse.ArgumentParser)
+        assert isinstance(parser, argparse.ArgumentParser)
 
     def test_parser_arguments(self):
         """Test that parser has required arguments."""
         parser = create_parser()
         args = parser.parse_args(["--input", "test.yaml"])
-        self.assertEqual(args.input, "test.yaml")
+        assert args.input == "test.yaml"
 
     def test_process_input_with_basic_config(self):
         """Test processing input with basic config structure."""
@@ -81,23 +82,23 @@ output:
             config = process_input(tmp_path)
 
             # Test that config is loaded correctly
-            self.assertIsInstance(config, dict)
-            self.assertIn("graph", config)
-            self.assertIn("data", config)
-            self.assertIn("output", config)
+            assert isinstance(config, dict)
+            assert "graph" in config
+            assert "data" in config
+            assert "output" in config
 
             # Test data sources structure
-            self.assertIn("sources", config["data"])
+            assert "sources" in config["data"]
             sources = config["data"]["sources"]
-            self.assertIsInstance(sources, list)
-            self.assertEqual(len(sources), 3)
+            assert isinstance(sources, list)
+            assert len(sources) == 3
 
             # Test individual source structure
             for i, source in enumerate(sources, 1):
-                self.assertIn("file", source)
-                self.assertIn("label", source)
-                self.assertEqual(source["file"], f"ex{i}.csv")
-                self.assertEqual(source["label"], f"ex{i}")
+                assert "file" in source
+                assert "label" in source
+                assert source["file"] == f"ex{i}.csv"
+                assert source["label"] == f"ex{i}"
 
         finally:
             os.unlink(tmp_path)
@@ -111,7 +112,7 @@ output:
         }
 
         config = create_graph_config(test_data)
-        self.assertEqual(config, test_data)
+        assert config == test_data
 
     @patch("simple_grapher.cli.process_input")
     @patch("simple_grapher.core.graph_builder.GraphBuilder.create_graph_from_config")
@@ -137,7 +138,7 @@ output:
         # Test with valid arguments
         with patch("sys.argv", ["simple-grapher", "--input", "test.yaml"]):
             result = main()
-            self.assertEqual(result, 0)
+            assert result == 0
             mock_process_input.assert_called_once_with("test.yaml")
             mock_create_graph.assert_called_once()
             mock_save_graph.assert_called_once()
@@ -145,9 +146,5 @@ output:
     def test_main_with_missing_input(self):
         """Test main function with missing required input."""
         with patch("sys.argv", ["simple-grapher"]):
-            with self.assertRaises(SystemExit):
+            with pytest.raises(SystemExit):
                 main()
-
-
-if __name__ == "__main__":
-    unittest.main()
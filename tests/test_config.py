@@ -5,6 +5,7 @@ Tests for the Config module.
 import tempfile
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from simple_grapher.core import Config
@@ -126,6 +127,50 @@ output:
         finally:
             Path(temp_file).unlink()
 
+    def test_config_from_yaml_file_reloads_on_change(self):
+        """Test that cached configs are independent and refreshed on file change."""
+        yaml_content = """
+graph:
+  title: "First Title"
+data:
+  sources:
+    - file: "data.csv"
+"""
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+            f.write(yaml_content)
+            temp_file = f.name
+
+        try:
+            config = Config.from_yaml_file(temp_file)
+            config.graph.title = "Mutated"
+            config.data.add_source("other.csv")
+
+            config = Config.from_yaml_file(temp_file)
+            assert config.graph.title == "First Title"
+            assert len(config.data.sources) == 1
+
+            Path(temp_file).write_text(
+                yaml_content.replace("First Title", "Second Title")
+            )
+            config = Config.from_yaml_file(temp_file)
+            assert config.graph.title == "Second Title"
+        finally:
+            Path(temp_file).unlink()
+
+    def test_config_from_yaml_file_invalid_config_always_raises(self):
+        """Test that invalid configs are never served from the cache."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+            f.write('output:\n  format: "invalid"\n')
+            temp_file = f.name
+
+        try:
+            for _ in range(2):
+                with pytest.raises(ValueError, match="Invalid format"):
+                    Config.from_yaml_file(temp_file)
+        finally:
+            Path(temp_file).unlink()
+
     def test_config_to_dict(self):
         """Test converting config to dictionary."""
         config = Config()
@@ -149,6 +194,20 @@ output:
         assert config_dict["output"]["format"] == "svg"
         assert config_dict["output"]["save_path"] == "./test.svg"
 
+    def test_config_to_dict_keeps_field_values(self):
+        """Test that values set programmatically are returned unchanged."""
+        config = Config()
+        config.graph.x_axis.min = np.float64(1.5)
+        config.graph.y_axis.max = np.int64(10)
+        config.output.save_path = Path("out") / "graph.png"
+
+        config_dict = config.to_dict()
+
+        assert config_dict["graph"]["x_axis"]["min"] == np.float64(1.5)
+        assert type(config_dict["graph"]["x_axis"]["min"]) is np.float64
+        assert type(config_dict["graph"]["y_axis"]["max"]) is np.int64
+        assert config_dict["output"]["save_path"] == Path("out") / "graph.png"
+
     def test_config_validation(self):
         """Test config validation."""
         config = Config()
@@ -2,179 +2,218 @@
 Tests for core functionality.
 """
 
+import io
 import os
 import tempfile
-import unittest
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
+import pytest
 
+from simple_grapher.core.config import StyleConfig
 from simple_grapher.core.data_processor import DataProcessor
-from simple_grapher.core.graph_builder import GraphBuilder
-from simple_grapher.utils.yaml_parser import parse_config_file
+from simple_grapher.core.graph_builder import GraphBuilder, _lttb_downsample
+from simple_grapher.utils.yaml_parser import YAMLParser
 
+BASIC_CONFIG_YAML = """
+graph:
+  title: "Sample Data Visualization"
+  x_axis:
+    label: "Time (seconds)"
+    min: 0
+    max: 100
+  y_axis:
+    label: "Value"
+    min: 0
+    max: 50
+  style:
+    width: 10
+    height: 10
+    fonts:
+      title_size: 16
+      label_size: 12
+      legend_size: 10
+    grid:
+      show: true
 
-class TestDataProcessor(unittest.TestCase):
-    """Test cases for DataProcessor class."""
+data:
+  sources:
+    - file: "ex1.csv"
+      label: "ex1"
+    - file: "ex2.csv"
+      label: "ex2"
+    - file: "ex3.csv"
+      label: "ex3"
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.processor = DataProcessor()
-        self.sample_config = {
-            "data": {
-                "sources": [
-                    {"file": "ex1.csv", "label": "ex1"},
-                    {"file": "ex2.csv", "label": "ex2"},
-                    {"file": "ex3.csv", "label": "ex3"},
-                ]
-            }
-        }
-
-    def test_load_csv_with_valid_file(self):
-        """Test loading CSV with valid file."""
-        # Create a temporary CSV file
-        csv_content = "x,y\n1,2\n3,4\n5,6\n"
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as tmp:
-            tmp.write(csv_content)
-            tmp_path = tmp.name
+output:
+  format: "png"
+  dpi: 300
+  quality: "high"
+  save_path: "./output/graph.png"
+"""
 
-        try:
-            df = self.processor.load_csv(tmp_path)
-            self.assertIsInstance(df, pd.DataFrame)
-            self.assertEqual(len(df), 3)
-            self.assertListEqual(list(df.columns), ["x", "y"])
-            self.assertListEqual(list(df["x"]), [1, 3, 5])
-            self.assertListEqual(list(df["y"]), [2, 4, 6])
-        finally:
-            os.unlink(tmp_path)
 
-    def test_load_csv_with_custom_columns(self):
-        """Test loading CSV with custom column names - should use first two columns."""
-        csv_content = "time,value\n1,2\n3,4\n5,6\n"
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as tmp:
-            tmp.write(csv_content)
-            tmp_path = tmp.name
+@pytest.fixture(scope="module")
+def processor():
+    """DataProcessor shared by the module; it keeps no state between calls."""
+    return DataProcessor()
 
-        try:
-            df = self.processor.load_csv(tmp_path)
-            self.assertIsInstance(df, pd.DataFrame)
-            self.assertEqual(len(df), 3)
-            self.assertListEqual(list(df.columns), ["x", "y"])
-            self.assertListEqual(list(df["x"]), [1, 3, 5])
-            self.assertListEqual(list(df["y"]), [2, 4, 6])
-        finally:
-            os.unlink(tmp_path)
 
-    def test_load_csv_with_missing_file(self):
+@pytest.fixture(scope="module")
+def builder():
+    """GraphBuilder shared by the module, redrawing into one figure.
+
+    Tests only inspect the figure they just created.
+    """
+    return GraphBuilder(reuse_figure=True)
+
+
+class TestDataProcessor:
+    """Test cases for DataProcessor class."""
+
+    @pytest.mark.parametrize(
+        "csv_fixture, as_file_object",
+        [("xy_csv", False), ("time_value_csv", True)],
+        ids=["path", "custom-columns-file-object"],
+    )
+    def test_load_csv(self, processor, request, csv_fixture, as_file_object):
+        """Test loading CSV from a path or file object; the first two columns are
+        used as x,y whatever their names."""
+        csv_path = request.getfixturevalue(csv_fixture)
+        if as_file_object:
+            with open(csv_path) as file:
+                df = processor.load_csv(file)
+        else:
+            df = processor.load_csv(str(csv_path))
+
+        assert isinstance(df, pd.DataFrame)
+        assert len(df) == 3
+        assert list(df.columns) == ["x", "y"]
+        np.testing.assert_array_equal(df["x"].to_numpy(), np.array([1, 3, 5]))
+        np.testing.assert_array_equal(df["y"].to_numpy(), np.array([2, 4, 6]))
+
+    def test_load_csv_with_missing_file(self, processor):
         """Test loading CSV with missing file."""
-        df = self.processor.load_csv("nonexistent.csv")
-        self.assertIsNone(df)
+        df = processor.load_csv("nonexistent.csv")
+        assert df is None
 
-    def test_load_csv_with_insufficient_columns(self):
+    def test_load_csv_with_insufficient_columns(self, processor):
         """Test loading CSV with insufficient columns (less than 2)."""
         csv_content = "a\n1\n3\n"
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as tmp:
-            tmp.write(csv_content)
-            tmp_path = tmp.name
 
-        try:
-            df = self.processor.load_csv(tmp_path)
-            self.assertIsNone(df)
-        finally:
-            os.unlink(tmp_path)
+        df = processor.load_csv(io.StringIO(csv_content))
+        assert df is None
 
-    def test_load_multiple_csvs(self):
-        """Test loading multiple CSV files."""
-        # Create two temporary CSV files
-        csv1_content = "x,y\n1,2\n3,4\n"
-        csv2_content = "x,y\n5,6\n7,8\n"
+    def test_load_csv_from_path_matches_pandas(self, processor, tmp_path):
+        """Test that file paths load the same whichever CSV reader is used."""
+        contents = [
+            "x,y,z\n1,2.5,a\n3,,b\n",
+            "x,y\n1,2\n3,4,5\n",
+            "day,y\n2020-01-01,1\n2020-01-02,2\n",
+            "a,a\n1,2\n",
+        ]
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as tmp1:
-            tmp1.write(csv1_content)
-            tmp1_path = tmp1.name
+        for i, content in enumerate(contents):
+            path = tmp_path / f"data{i}.csv"
+            path.write_text(content)
+
+            expected = pd.read_csv(path, usecols=[0, 1])
+            expected.columns = ["x", "y"]
+            pd.testing.assert_frame_equal(processor.load_csv(path), expected)
+
+        (tmp_path / "one.csv").write_text("a\n1\n")
+        assert processor.load_csv(tmp_path / "one.csv") is None
+
+    def test_load_csv_matches_without_pyarrow(self, processor, tmp_path, monkeypatch):
+        """Test that values pyarrow infers differently keep the pandas dtypes."""
+        contents = [
+            "x,y\n1,2.5\n3,4\n",
+            "x,y\n1,0x10\n2,0x20\n",
+            "x,y\n1,+5\n2,-6\n",
+            "x,y\n1,18446744073709551615\n2,1\n",
+            "x,y\n1,99999999999999999999\n2,1\n",
+            "x,y\n1,1.0\n2,inf\n",
+            "x,y\n1,N/A\n2,3\n",
+        ]
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as tmp2:
-            tmp2.write(csv2_content)
-            tmp2_path = tmp2.name
+        loaded = []
+        for i, content in enumerate(contents):
+            path = tmp_path / f"data{i}.csv"
+            path.write_text(content)
+            loaded.append(processor.load_csv(path))
 
-        try:
-            sources = [
-                {"file": tmp1_path, "label": "data1"},
-                {"file": tmp2_path, "label": "data2"},
-            ]
-
-            dataframes = self.processor.load_multiple_csvs(sources)
-            self.assertIsInstance(dataframes, dict)
-            self.assertEqual(len(dataframes), 2)
-            self.assertIn("data1", dataframes)
-            self.assertIn("data2", dataframes)
-            self.assertIsInstance(dataframes["data1"], pd.DataFrame)
-            self.assertIsInstance(dataframes["data2"], pd.DataFrame)
-        finally:
-            os.unlink(tmp1_path)
-            os.unlink(tmp2_path)
+        monkeypatch.setattr("simple_grapher.core.data_processor.pa_csv", None)
+        for i, df in enumerate(loaded):
+            expected = processor.load_csv(tmp_path / f"data{i}.csv")
+            pd.testing.assert_frame_equal(df, expected)
 
-    def test_process_data_with_sources_list(self):
-        """Test data processing with sources list."""
-        # Create a temporary CSV file
-        csv_content = "x,y\n1,2\n3,4\n"
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as tmp:
-            tmp.write(csv_content)
-            tmp_path = tmp.name
+    def test_load_multiple_csvs(self, processor, small_xy_csv, other_xy_csv):
+        """Test loading multiple CSV files."""
+        sources = [
+            {"file": str(small_xy_csv), "label": "data1"},
+            {"file": str(other_xy_csv), "label": "data2"},
+        ]
 
-        try:
-            sources = [{"file": tmp_path, "label": "test_data"}]
-            result = self.processor.process_data(sources)
-            self.assertIsInstance(result, dict)
-            self.assertIn("test_data", result)
-            self.assertIsInstance(result["test_data"], pd.DataFrame)
-        finally:
-            os.unlink(tmp_path)
+        dataframes = processor.load_multiple_csvs(sources)
+        assert isinstance(dataframes, dict)
+        assert len(dataframes) == 2
+        assert "data1" in dataframes
+        assert "data2" in dataframes
+        assert isinstance(dataframes["data1"], pd.DataFrame)
+        assert isinstance(dataframes["data2"], pd.DataFrame)
 
-    def test_process_data_with_single_source(self):
-        """Test data processing with single source."""
-        csv_content = "x,y\n1,2\n3,4\n"
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as tmp:
-            tmp.write(csv_content)
-            tmp_path = tmp.name
+    def test_process_data_with_sources_list(self, processor, small_xy_csv):
+        """Test data processing with sources list."""
+        sources = [{"file": str(small_xy_csv), "label": "test_data"}]
+        result = processor.process_data(sources)
+        assert isinstance(result, dict)
+        assert "test_data" in result
+        assert isinstance(result["test_data"], pd.DataFrame)
 
-        try:
-            single_source = {"file": tmp_path, "label": "test_data"}
-            result = self.processor.process_data(single_source)
-            self.assertIsInstance(result, pd.DataFrame)
-            self.assertEqual(len(result), 2)
-        finally:
-            os.unlink(tmp_path)
+    def test_process_data_with_single_source(self, processor, small_xy_csv):
+        """Test data processing with single source."""
+        single_source = {"file": str(small_xy_csv), "label": "test_data"}
+        result = processor.process_data(single_source)
+        assert isinstance(result, pd.DataFrame)
+        assert len(result) == 2
 
-    def test_process_data_with_string_path(self):
+    def test_process_data_with_string_path(self, processor, small_xy_csv):
         """Test data processing with string path."""
-        csv_content = "x,y\n1,2\n3,4\n"
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as tmp:
-            tmp.write(csv_content)
-            tmp_path = tmp.name
+        result = processor.process_data(str(small_xy_csv))
+        assert isinstance(result, pd.DataFrame)
+        assert len(result) == 2
+
+    def test_validate_sources(self, processor, tmp_path):
+        """Test source validation reports problems in source order."""
+        present = tmp_path / "present.csv"
+        present.write_text("x,y\n1,2\n")
+        empty = tmp_path / "empty.csv"
+        empty.touch()
+        missing = tmp_path / "missing.csv"
+
+        sources = [
+            {"file": str(present), "label": "present"},
+            "not a dict",
+            {"label": "no file"},
+            {"file": str(missing)},
+            {"file": str(empty), "label": "empty"},
+        ]
 
-        try:
-            result = self.processor.process_data(tmp_path)
-            self.assertIsInstance(result, pd.DataFrame)
-            self.assertEqual(len(result), 2)
-        finally:
-            os.unlink(tmp_path)
+        errors = processor.validate_sources(sources)
+        assert errors == [
+            "Source 1 is not a dictionary",
+            "Source 2 missing required 'file' field",
+            "Source 3 missing required 'label' field",
+            f"Source 3 file '{missing}' not found",
+            f"Source 4 file '{empty}' is empty",
+        ]
 
 
-class TestGraphBuilder(unittest.TestCase):
+class TestGraphBuilder:
     """Test cases for GraphBuilder class."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.builder = GraphBuilder()
-        self.sample_data = {
-            "sources": [
-                {"file": "ex1.csv", "label": "ex1"},
-                {"file": "ex2.csv", "label": "ex2"},
-            ]
-        }
-
-    def test_create_graph_with_data_sources(self):
+    def test_create_graph_with_data_sources(self, builder):
         """Test graph creation with data sources list."""
         # Create sample DataFrames
         df1 = pd.DataFrame({"x": [1, 2, 3], "y": [4, 5, 6]})
@@ -185,145 +224,273 @@ class TestGraphBuilder(unittest.TestCase):
             {"dataframe": df2, "label": "Dataset 2"},
         ]
 
-        result = self.builder.create_graph(data_sources, "line", "Test Graph", "X", "Y")
-        self.assertIsNotNone(result)
-        self.assertIsInstance(result, plt.Figure)
+        result = builder.create_graph(data_sources, "line", "Test Graph", "X", "Y")
+        assert result is not None
+        assert isinstance(result, plt.Figure)
 
-    def test_create_graph_with_different_types(self):
+    def test_create_graph_with_different_types(self, builder):
         """Test graph creation with different graph types."""
         df = pd.DataFrame({"x": [1, 2, 3], "y": [4, 5, 6]})
         data_sources = [{"dataframe": df, "label": "Test Data"}]
 
         graph_types = ["line", "bar", "scatter"]
         for graph_type in graph_types:
-            result = self.builder.create_graph(data_sources, graph_type)
-            self.assertIsNotNone(result)
-            self.assertIsInstance(result, plt.Figure)
+            result = builder.create_graph(data_sources, graph_type)
+            assert result is not None
+            assert isinstance(result, plt.Figure)
 
-    def test_create_graph_from_dataframes(self):
+    def test_create_graph_from_dataframes(self, builder):
         """Test graph creation from dictionary of DataFrames."""
         df1 = pd.DataFrame({"x": [1, 2, 3], "y": [4, 5, 6]})
         df2 = pd.DataFrame({"x": [1, 2, 3], "y": [2, 4, 6]})
 
         dataframes = {"Dataset 1": df1, "Dataset 2": df2}
 
-        result = self.builder.create_graph_from_dataframes(
-            dataframes, "line", "Test Graph"
-        )
-        self.assertIsNotNone(result)
-        self.assertIsInstance(result, plt.Figure)
+        result = builder.create_graph_from_dataframes(dataframes, "line", "Test Graph")
+        assert result is not None
+        assert isinstance(result, plt.Figure)
+
+    def test_create_graph_from_arrays(self, builder):
+        """Test graph creation from a dictionary of (x, y) arrays."""
+        x = np.array([1, 2, 3])
+        arrays = {"Dataset 1": (x, np.array([4, 5, 6])), "Dataset 2": (x, [2, 4, 6])}
+
+        for graph_type in builder.get_supported_types():
+            result = builder.create_graph_from_arrays(arrays, graph_type)
+            assert isinstance(result, plt.Figure)
+
+    def test_create_graph_batches_many_lines(self, builder):
+        """Test that many plain line sources are drawn as one collection."""
+        x = np.arange(10)
+        arrays = {f"Dataset {i}": (x, x * i) for i in range(20)}
+        style = StyleConfig()
+        style.line_style.auto_cycle = False
+
+        result = builder.create_graph_from_arrays(arrays, style_config=style)
+        ax = result.axes[0]
+        assert len(ax.collections) == 1
+        assert len(ax.collections[0].get_segments()) == 20
+        labels = [text.get_text() for text in ax.get_legend().get_texts()]
+        assert labels == list(arrays)
+
+    def test_create_graph_reuses_figure(self):
+        """Test that a reusing builder clears and reuses its figure."""
+        builder = GraphBuilder(reuse_figure=True)
+        df = pd.DataFrame({"x": [1, 2, 3], "y": [4, 5, 6]})
+        data_sources = [{"dataframe": df, "label": "Test Data"}]
+
+        first = builder.create_graph(data_sources, "line", "First")
+        second = builder.create_graph(data_sources, "scatter", "Second")
+        assert first is second
+        assert len(builder.ax.lines) == 0
+        assert builder.ax.get_title() == "Second"
+
+        # Each figure size keeps its own figure
+        small_style = StyleConfig(width=4, height=3)
+        small = builder.create_graph(data_sources, style_config=small_style)
+        assert small is not first
+        assert builder.create_graph(data_sources) is first
+        assert builder.create_graph(data_sources, style_config=small_style) is small
+
+        builder.close()
+        assert builder.fig is None
+        assert builder.ax is None
+
+    def test_create_graph_from_config_defaults(self, builder):
+        """Test that missing graph settings fall back to defaults."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_path = os.path.join(tmp_dir, "data.csv")
+            with open(csv_path, "w") as f:
+                f.write("x,y\n1,2\n3,4\n")
+            config = {
+                "graph": {"x_axis": {}},
+                "data": {"sources": [{"file": csv_path, "label": "data"}]},
+            }
+
+            result = builder.create_graph_from_config(config, DataProcessor())
 
-    def test_create_graph_with_invalid_type(self):
+        assert result is not None
+        ax = result.axes[0]
+        assert ax.get_title() == "Graph"
+        assert ax.get_xlabel() == "X"
+        assert ax.get_ylabel() == "Y"
+        assert config["graph"] == {"x_axis": {}}
+
+    def test_create_graph_with_invalid_type(self, builder):
         """Test graph creation with invalid graph type."""
         df = pd.DataFrame({"x": [1, 2, 3], "y": [4, 5, 6]})
         data_sources = [{"dataframe": df, "label": "Test Data"}]
 
-        result = self.builder.create_graph(data_sources, "invalid_type")
-        self.assertIsNone(result)
+        result = builder.create_graph(data_sources, "invalid_type")
+        assert result is None
 
-    def test_create_graph_with_empty_sources(self):
+    def test_create_graph_with_empty_sources(self, builder):
         """Test graph creation with empty data sources."""
-        result = self.builder.create_graph([], "line")
-        self.assertIsNone(result)
+        result = builder.create_graph([], "line")
+        assert result is None
 
-    def test_save_graph(self):
+    def test_save_graph(self, builder):
         """Test graph saving functionality."""
         # Create a sample graph
         df = pd.DataFrame({"x": [1, 2, 3], "y": [4, 5, 6]})
         data_sources = [{"dataframe": df, "label": "Test Data"}]
-        figure = self.builder.create_graph(data_sources, "line")
+        figure = builder.create_graph(data_sources, "line")
 
-        self.assertIsNotNone(figure)
+        assert figure is not None
 
         with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
             tmp_path = tmp.name
 
         try:
-            result = self.builder.save_graph(figure, tmp_path)
-            self.assertTrue(result)
-            self.assertTrue(os.path.exists(tmp_path))
+            result = builder.save_graph(figure, tmp_path)
+            assert result
+            assert os.path.exists(tmp_path)
         finally:
             if os.path.exists(tmp_path):
                 os.unlink(tmp_path)
 
+    def test_save_graph_skip_unchanged_detects_changes(self, builder):
+        """Test that any change to the rendered graph is saved again."""
+        df = pd.DataFrame({"x": ["a", "b", "c"], "y": [4, 5, 6]})
+        renamed = pd.DataFrame({"x": ["a", "b", "d"], "y": [4, 5, 6]})
+
+        # The builder reuses its figure, so each graph is built just before saving
+        changes = [
+            lambda ax: ax.set_xticks([0, 1, 2], ["a", "b", "d"]),
+            lambda ax: ax.legend(["Renamed"]),
+            lambda ax: ax.set_facecolor("lightgray"),
+            lambda ax: ax.lines[0].set_alpha(0.5),
+            lambda ax: ax.spines["top"].set_visible(False),
+            lambda ax: ax.grid(False),
+            lambda ax: ax.imshow([[0, 1]]),
+        ]
 
-class TestIntegrationWithBasicConfig(unittest.TestCase):
-    """Test integration with basic_config.yaml structure."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = os.path.join(tmp_dir, "graph.png")
+            figure = builder.create_graph([{"dataframe": df, "label": "Series"}])
+            assert builder.save_graph(figure, tmp_path, dpi=50)
+
+            for change in changes:
+                figure = builder.create_graph([{"dataframe": df, "label": "Series"}])
+                change(figure.axes[0])
+                os.utime(tmp_path, (0, 0))
+                assert builder.save_graph(figure, tmp_path, dpi=50, skip_unchanged=True)
+                assert os.path.getmtime(tmp_path) != 0
+
+            for data_sources in (
+                [{"dataframe": renamed, "label": "Series"}],
+                [{"dataframe": renamed, "label": "Renamed series"}],
+            ):
+                figure = builder.create_graph(data_sources)
+                os.utime(tmp_path, (0, 0))
+                assert builder.save_graph(figure, tmp_path, dpi=50, skip_unchanged=True)
+                assert os.path.getmtime(tmp_path) != 0
+
+            # Settings applied through rcParams are picked up as well
+            with plt.rc_context({"axes.edgecolor": "red"}):
+                figure = builder.create_graph([{"dataframe": df, "label": "Series"}])
+            os.utime(tmp_path, (0, 0))
+            assert builder.save_graph(figure, tmp_path, dpi=50, skip_unchanged=True)
+            assert os.path.getmtime(tmp_path) != 0
+
+    def test_save_graph_failure_keeps_existing_file(self, builder):
+        """Test that a failed save leaves an existing graph untouched."""
+        df = pd.DataFrame({"x": [1, 2, 3], "y": [4, 5, 6]})
+        figure = builder.create_graph([{"dataframe": df, "label": "Test Data"}])
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.basic_config_yaml = """
-graph:
-  title: "Sample Data Visualization"
-  x_axis:
-    label: "Time (seconds)"
-    min: 0
-    max: 100
-  y_axis:
-    label: "Value"
-    min: 0
-    max: 50
-  style:
-    width: 10
-    height: 10
-    fonts:
-      title_size: 16
-      label_size: 12
-      legend_size: 10
-    grid:
-      show: true
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = os.path.join(tmp_dir, "graph.png")
+            assert builder.save_graph(figure, tmp_path, dpi=50)
+            with open(tmp_path, "rb") as f:
+                original = f.read()
 
-data:
-  sources:
-    - file: "ex1.csv"
-      label: "ex1"
-    - file: "ex2.csv"
-      label: "ex2"
-    - file: "ex3.csv"
-      label: "ex3"
+            assert not builder.save_graph(figure, tmp_path, format="bogus")
+            with open(tmp_path, "rb") as f:
+                assert f.read() == original
 
-output:
-  format: "png"
-  dpi: 300
-  quality: "high"
-  save_path: "./output/graph.png"
-"""
+    def test_save_graph_skip_unchanged(self, builder):
+        """Test that unchanged graphs are not saved again."""
+        df = pd.DataFrame({"x": [1, 2, 3], "y": [4, 5, 6]})
+        data_sources = [{"dataframe": df, "label": "Test Data"}]
 
-    def test_parse_basic_config_structure(self):
-        """Test parsing the basic config structure."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as tmp:
-            tmp.write(self.basic_config_yaml)
-            tmp_path = tmp.name
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = os.path.join(tmp_dir, "graph.png")
 
-        try:
-            config = parse_config_file(tmp_path)
-
-            # Test graph configuration
-            self.assertEqual(config["graph"]["title"], "Sample Data Visualization")
-            self.assertEqual(config["graph"]["x_axis"]["label"], "Time (seconds)")
-            self.assertEqual(config["graph"]["y_axis"]["label"], "Value")
-
-            # Test data sources
-            self.assertIn("sources", config["data"])
-            sources = config["data"]["sources"]
-            self.assertIsInstance(sources, list)
-            self.assertEqual(len(sources), 3)
-
-            # Test individual source structure
-            for i, source in enumerate(sources, 1):
-                self.assertIn("file", source)
-                self.assertIn("label", source)
-                self.assertEqual(source["file"], f"ex{i}.csv")
-                self.assertEqual(source["label"], f"ex{i}")
-
-            # Test output configuration
-            self.assertEqual(config["output"]["format"], "png")
-            self.assertEqual(config["output"]["dpi"], 300)
-            self.assertEqual(config["output"]["save_path"], "./output/graph.png")
+            figure = builder.create_graph(data_sources, "line")
+            assert builder.save_graph(figure, tmp_path, dpi=50, skip_unchanged=True)
+            os.utime(tmp_path, (0, 0))
 
-        finally:
-            os.unlink(tmp_path)
+            # Same figure: the file is left alone
+            figure = builder.create_graph(data_sources, "line")
+            assert builder.save_graph(figure, tmp_path, dpi=50, skip_unchanged=True)
+            assert os.path.getmtime(tmp_path) == 0
+
+            # Without skip_unchanged the file is always written
+            assert builder.save_graph(figure, tmp_path, dpi=50)
+            assert os.path.getmtime(tmp_path) != 0
+
+            # A corrupted file of the same size is replaced
+            with open(tmp_path, "r+b") as f:
+                f.seek(-1, os.SEEK_END)
+                f.write(b"\0")
+            os.utime(tmp_path, (0, 0))
+            assert builder.save_graph(figure, tmp_path, dpi=50, skip_unchanged=True)
+            assert os.path.getmtime(tmp_path) != 0
+
+
+class TestLTTBDownsample:
+    """Test cases for LTTB downsampling."""
+
+    def test_downsample_keeps_endpoints_and_peaks(self):
+        """Test that downsampling keeps the endpoints and a sharp spike."""
+        x = np.arange(1000, dtype=float)
+        y = np.zeros(1000)
+        y[500] = 10.0
+
+        x_out, y_out = _lttb_downsample(x, y, 50)
 
+        assert len(x_out) == len(y_out) == 50
+        assert x_out[0] == 0 and x_out[-1] == 999
+        assert np.all(np.diff(x_out) > 0)
+        assert 10.0 in y_out
 
-if __name__ == "__main__":
-    unittest.main()
+    def test_downsample_returns_small_input_unchanged(self):
+        """Test that inputs at or below the target size are returned as-is."""
+        x = np.arange(10)
+        y = np.arange(10)
+
+        x_out, y_out = _lttb_downsample(x, y, 10)
+
+        assert x_out is x
+        assert y_out is y
+
+
+class TestIntegrationWithBasicConfig:
+    """Test integration with basic_config.yaml structure."""
+
+    def test_parse_basic_config_structure(self):
+        """Test parsing the basic config structure."""
+        config = YAMLParser().load_string(BASIC_CONFIG_YAML)
+
+        # Test graph configuration
+        assert config["graph"]["title"] == "Sample Data Visualization"
+        assert config["graph"]["x_axis"]["label"] == "Time (seconds)"
+        assert config["graph"]["y_axis"]["label"] == "Value"
+
+        # Test data sources
+        assert "sources" in config["data"]
+        sources = config["data"]["sources"]
+        assert isinstance(sources, list)
+        assert len(sources) == 3
+
+        # Test individual source structure
+        for i, source in enumerate(sources, 1):
+            assert "file" in source
+            assert "label" in source
+            assert source["file"] == f"ex{i}.csv"
+            assert source["label"] == f"ex{i}"
+
+        # Test output configuration
+        assert config["output"]["format"] == "png"
+        assert config["output"]["dpi"] == 300
+        assert config["output"]["save_path"] == "./output/graph.png"
@@ -2,9 +2,14 @@
 Tests for YAML parser functionality.
 """
 
+import copy
 import os
+import subprocess
+import sys
 import tempfile
-import unittest
+
+import pytest
+import yaml
 
 from simple_grapher.utils.yaml_parser import (
     YAMLParser,
@@ -12,14 +17,7 @@ from simple_grapher.utils.yaml_parser import (
     parse_data_file,
 )
 
-
-class TestYAMLParser(unittest.TestCase):
-    """Test cases for YAMLParser class."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        self.parser = YAMLParser()
-        self.sample_yaml = """
+SAMPLE_YAML = """
 graph:
   title: "Test Graph"
   type: "line"
@@ -59,62 +57,110 @@ output:
   save_path: "./output/graph.png"
 """
 
-    def test_load_string(self):
+# SAMPLE_YAML parsed once for tests that only need a loaded parser
+SAMPLE_DATA = yaml.safe_load(SAMPLE_YAML)
+
+
+@pytest.fixture
+def parser():
+    """Fresh YAMLParser; parsers keep the last loaded data, so it isn't shared."""
+    return YAMLParser()
+
+
+@pytest.fixture
+def loaded_parser(parser):
+    """Parser holding a private copy of SAMPLE_DATA."""
+    parser.data = copy.deepcopy(SAMPLE_DATA)
+    return parser
+
+
+class TestYAMLParser:
+    """Test cases for YAMLParser class."""
+
+    def test_load_string(self, parser):
         """Test loading YAML from string."""
-        data = self.parser.load_string(self.sample_yaml)
-        self.assertIsInstance(data, dict)
-        self.assertIn("graph", data)
-        self.assertEqual(data["graph"]["title"], "Test Graph")
+        data = parser.load_string(SAMPLE_YAML)
+        assert isinstance(data, dict)
+        assert "graph" in data
+        assert data["graph"]["title"] == "Test Graph"
+        assert data == SAMPLE_DATA
 
-    def test_load_file(self):
+    def test_load_file(self, parser):
         """Test loading YAML from file."""
         with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as tmp:
-            tmp.write(self.sample_yaml)
+            tmp.write(SAMPLE_YAML)
             tmp_path = tmp.name
 
         try:
-            data = self.parser.load_file(tmp_path)
-            self.assertIsInstance(data, dict)
-            self.assertIn("graph", data)
+            data = parser.load_file(tmp_path)
+            assert isinstance(data, dict)
+            assert "graph" in data
         finally:
             os.unlink(tmp_path)
 
-    def test_get_value(self):
-        """Test getting values using dot notation."""
-        self.parser.load_string(self.sample_yaml)
+    def test_load_file_returns_independent_copies(self, parser):
+        """Test that repeated loads of an unchanged file don't share state."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as tmp:
+            tmp.write(SAMPLE_YAML)
+            tmp_path = tmp.name
+
+        try:
+            data = parser.load_file(tmp_path)
+            data["graph"]["title"] = "Mutated"
+            data["data"]["sources"].clear()
+
+            data = YAMLParser().load_file(tmp_path)
+            assert data["graph"]["title"] == "Test Graph"
+            assert len(data["data"]["sources"]) == 3
+
+            # Read-only loads share the cached result instead of copying it
+            shared = YAMLParser().load_file(tmp_path, mutable=False)
+            assert shared is YAMLParser().load_file(tmp_path, mutable=False)
+            assert shared == data
+        finally:
+            os.unlink(tmp_path)
 
+    def test_get_value(self, loaded_parser):
+        """Test getting values using dot notation."""
         # Test simple key
-        self.assertEqual(self.parser.get_value("graph.title"), "Test Graph")
+        assert loaded_parser.get_value("graph.title") == "Test Graph"
 
         # Test nested key
-        self.assertEqual(self.parser.get_value("graph.x_axis.label"), "Time (seconds)")
+        assert loaded_parser.get_value("graph.x_axis.label") == "Time (seconds)"
+
+        # Test pre-split key path
+        assert loaded_parser.get_value(("graph", "x_axis", "label")) == "Time (seconds)"
+        assert (
+            loaded_parser.get_value_path(("graph", "x_axis", "label"))
+            == "Time (seconds)"
+        )
+        assert loaded_parser.get_value_path(("graph", "nope"), 1) == 1
 
         # Test sources list access
-        sources = self.parser.get_value("data.sources")
-        self.assertIsInstance(sources, list)
-        self.assertEqual(len(sources), 3)
-        self.assertEqual(sources[0]["file"], "ex1.csv")
-        self.assertEqual(sources[0]["label"], "ex1")
+        sources = loaded_parser.get_value("data.sources")
+        assert isinstance(sources, list)
+        assert len(sources) == 3
+        assert sources[0]["file"] == "ex1.csv"
+        assert sources[0]["label"] == "ex1"
 
         # Test non-existent key
-        self.assertIsNone(self.parser.get_value("nonexistent"))
+        assert loaded_parser.get_value("nonexistent") is None
 
         # Test default value
-        self.assertEqual(self.parser.get_value("nonexistent", "default"), "default")
+        assert loaded_parser.get_value("nonexistent", "default") == "default"
 
-    def test_validate_schema(self):
+    def test_validate_schema(self, loaded_parser):
         """Test schema validation."""
-        self.parser.load_string(self.sample_yaml)
-
         # Test with valid required keys
         required_keys = ["graph.title", "data.sources"]
-        self.assertTrue(self.parser.validate_schema(required_keys))
+        assert loaded_parser.validate_schema(required_keys)
+        assert loaded_parser.validate_schema([("graph", "title")])
 
         # Test with invalid required keys
         invalid_keys = ["nonexistent", "graph.title"]
-        self.assertFalse(self.parser.validate_schema(invalid_keys))
+        assert not loaded_parser.validate_schema(invalid_keys)
 
-    def test_save_file(self):
+    def test_save_file(self, parser):
         """Test saving data to YAML file."""
         test_data = {"test": "value", "nested": {"key": "nested_value"}}
 
@@ -122,20 +168,23 @@ output:
             tmp_path = tmp.name
 
         try:
-            self.parser.save_file(test_data, tmp_path)
+            parser.save_file(test_data, tmp_path)
 
             # Verify the file was created and contains correct data
-            self.assertTrue(os.path.exists(tmp_path))
+            assert os.path.exists(tmp_path)
 
             # Load it back and verify
-            loaded_data = self.parser.load_file(tmp_path)
-            self.assertEqual(loaded_data, test_data)
+            loaded_data = parser.load_file(tmp_path)
+            assert loaded_data == test_data
+
+            # Keys keep their insertion order
+            assert list(loaded_data) == ["test", "nested"]
         finally:
             if os.path.exists(tmp_path):
                 os.unlink(tmp_path)
 
 
-class TestConvenienceFunctions(unittest.TestCase):
+class TestConvenienceFunctions:
     """Test cases for convenience functions."""
 
     def test_parse_config_file(self):
@@ -170,9 +219,29 @@ output:
 
         try:
             data = parse_config_file(tmp_path)
-            self.assertEqual(data["graph"]["title"], "My Graph")
-            self.assertIn("sources", data["data"])
-            self.assertEqual(len(data["data"]["sources"]), 2)
+            assert data["graph"]["title"] == "My Graph"
+            assert "sources" in data["data"]
+            assert len(data["data"]["sources"]) == 2
+        finally:
+            os.unlink(tmp_path)
+
+    def test_parse_config_file_json(self):
+        """Test parse_config_file with a JSON config file."""
+        sample_config = '{"graph": {"title": "My Graph"}, "data": {"sources": []}}'
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as tmp:
+            tmp.write(sample_config)
+            tmp_path = tmp.name
+
+        try:
+            data = parse_config_file(tmp_path)
+            assert data["graph"]["title"] == "My Graph"
+            assert data["data"]["sources"] == []
+
+            with open(tmp_path, "w") as f:
+                f.write("[1, 2, 3]")
+            with pytest.raises(ValueError):
+                parse_config_file(tmp_path)
         finally:
             os.unlink(tmp_path)
 
@@ -192,11 +261,15 @@ datasets:
 
         try:
             data = parse_data_file(tmp_path)
-            self.assertIn("datasets", data)
-            self.assertEqual(len(data["datasets"]), 2)
+            assert "datasets" in data
+            assert len(data["datasets"]) == 2
         finally:
             os.unlink(tmp_path)
 
-
-if __name__ == "__main__":
-    unittest.main()
+    def test_import_does_not_load_numpy(self):
+        """Test that parsing configs doesn't pull in numpy."""
+        code = (
+            "import sys, simple_grapher.utils.yaml_parser; "
+            "assert 'numpy' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)